@@ -1,12 +1,12 @@
 """FastAPI应用配置"""
 
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import uvicorn
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.routing import Route
 from contextlib import asynccontextmanager
 
 from api.endpoints import news, events, labeling, system, tasks
+from api.middleware import FastCORS, StaticJSONEndpoint
 from utils.logger import get_logger
 from utils.exceptions import ServiceError, DatabaseError, AIServiceError
 from config.settings import get_settings
@@ -14,15 +14,20 @@ from config.settings import get_settings
 logger = get_logger(__name__)
 settings = get_settings()
 
+# 启动信息在导入时一次性拼接，生命周期内只输出一条日志
+_STARTUP_BANNER = (
+    "🚀 热榜聚合智能体服务启动中... | "
+    f"📊 数据库: {settings.database_host}:{settings.database_port} | "
+    f"🤖 AI服务: {settings.openai_base_url} | "
+    f"📝 日志级别: {settings.log_level}"
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """应用生命周期管理"""
     # 启动时执行
-    logger.info("🚀 热榜聚合智能体服务启动中...")
-    logger.info(f"📊 数据库: {settings.database_host}:{settings.database_port}")
-    logger.info(f"🤖 AI服务: {settings.openai_base_url}")
-    logger.info(f"📝 日志级别: {settings.log_level}")
+    logger.info(_STARTUP_BANNER)
     
     yield
     
@@ -30,25 +35,70 @@ async def lifespan(app: FastAPI):
     logger.info("🛑 热榜聚合智能体服务正在关闭...")
 
 
+# 全局异常分发表：(异常类型, 状态码, 响应错误标题, 日志前缀)
+# 按顺序匹配，子类必须排在父类之前；状态码为None时使用异常自带的status_code
+_ERROR_TABLE = (
+    (DatabaseError, 500, "数据库错误", "数据库错误"),
+    (AIServiceError, 503, "AI服务不可用", "AI服务错误"),
+    (ServiceError, 500, "服务错误", "服务错误"),
+    (HTTPException, None, "请求错误", "HTTP异常"),
+)
+
+
+async def _unified_exception_handler(request: Request, exc: Exception):
+    """统一的全局异常处理器"""
+    for exc_class, status_code, error_title, log_prefix in _ERROR_TABLE:
+        if isinstance(exc, exc_class):
+            if status_code is None:
+                logger.warning("{}: {} - {}", log_prefix, exc.status_code, exc.detail)
+                return JSONResponse(
+                    status_code=exc.status_code,
+                    content={"error": error_title, "detail": exc.detail}
+                )
+            logger.error("{}: {}", log_prefix, exc)
+            return JSONResponse(
+                status_code=status_code,
+                content={"error": error_title, "detail": str(exc)}
+            )
+    
+    logger.opt(exception=exc).error("未处理的异常: {}", exc)
+    return JSONResponse(
+        status_code=500,
+        content={"error": "内部服务器错误", "detail": "请联系管理员"}
+    )
+
+
+# 所有异常类型共用同一个处理器，在创建应用时一次性注册
+_EXCEPTION_HANDLERS = {exc_class: _unified_exception_handler for exc_class, *_ in _ERROR_TABLE}
+_EXCEPTION_HANDLERS[Exception] = _unified_exception_handler
+
+
 def create_app() -> FastAPI:
     """创建FastAPI应用实例"""
     
+    # 非开发环境关闭文档，避免构建OpenAPI模型树的启动开销
+    enable_docs = settings.enable_docs
+    
     app = FastAPI(
         title="热榜聚合智能体API",
         description="智能新闻热榜聚合与分析系统",
         version="1.0.0",
-        docs_url="/docs",
-        redoc_url="/redoc",
+        docs_url="/docs" if enable_docs else None,
+        redoc_url="/redoc" if enable_docs else None,
+        openapi_url="/openapi.json" if enable_docs else None,
+        default_response_class=ORJSONResponse,
+        exception_handlers=_EXCEPTION_HANDLERS,
         lifespan=lifespan
     )
     
-    # CORS中间件
+    # CORS中间件（纯ASGI实现，生产环境应该限制具体域名）
+    # 预检结果缓存一天，浏览器无需为每个跨域请求重新发送OPTIONS
     app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # 生产环境应该限制具体域名
-        allow_credentials=True,
-        allow_methods=["*"],
+        FastCORS,
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
         allow_headers=["*"],
+        allow_credentials=True,
+        max_age=86400,
     )
     
     # 注册路由
@@ -58,63 +108,19 @@ def create_app() -> FastAPI:
     app.include_router(system.router, prefix="/api/system", tags=["系统监控"])
     app.include_router(tasks.router, prefix="/api/tasks", tags=["任务管理"])
     
-    # 全局异常处理
-    @app.exception_handler(ServiceError)
-    async def service_error_handler(request: Request, exc: ServiceError):
-        logger.error(f"服务错误: {exc}")
-        return JSONResponse(
-            status_code=500,
-            content={"error": "服务错误", "detail": str(exc)}
-        )
-    
-    @app.exception_handler(DatabaseError)
-    async def database_error_handler(request: Request, exc: DatabaseError):
-        logger.error(f"数据库错误: {exc}")
-        return JSONResponse(
-            status_code=500,
-            content={"error": "数据库错误", "detail": str(exc)}
-        )
-    
-    @app.exception_handler(AIServiceError)
-    async def ai_service_error_handler(request: Request, exc: AIServiceError):
-        logger.error(f"AI服务错误: {exc}")
-        return JSONResponse(
-            status_code=503,
-            content={"error": "AI服务不可用", "detail": str(exc)}
-        )
-    
-    @app.exception_handler(HTTPException)
-    async def http_exception_handler(request: Request, exc: HTTPException):
-        logger.warning(f"HTTP异常: {exc.status_code} - {exc.detail}")
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"error": "请求错误", "detail": exc.detail}
-        )
-    
-    @app.exception_handler(Exception)
-    async def general_exception_handler(request: Request, exc: Exception):
-        logger.error(f"未处理的异常: {exc}", exc_info=True)
-        return JSONResponse(
-            status_code=500,
-            content={"error": "内部服务器错误", "detail": "请联系管理员"}
-        )
-    
-    # 根路径
-    @app.get("/")
-    async def root():
-        """根路径欢迎信息"""
-        return {
-            "message": "🔥 热榜聚合智能体API服务",
-            "version": "1.0.0",
-            "docs": "/docs",
-            "health": "/api/system/health"
-        }
-    
-    # 健康检查
-    @app.get("/health")
-    async def health_check():
-        """简单健康检查"""
-        return {"status": "healthy", "service": "hot-list-aggregation"}
+    # 根路径与健康检查内容固定，以纯ASGI端点挂在路由表最前面
+    # 探针请求直接写出预编码的字节，不经过依赖解析和响应编码
+    root = StaticJSONEndpoint({
+        "message": "🔥 热榜聚合智能体API服务",
+        "version": "1.0.0",
+        "docs": "/docs" if enable_docs else None,
+        "health": "/api/system/health"
+    })
+    health_check = StaticJSONEndpoint({"status": "healthy", "service": "hot-list-aggregation"})
+    app.router.routes[0:0] = [
+        Route("/health", health_check, methods=["GET"], include_in_schema=False),
+        Route("/", root, methods=["GET"], include_in_schema=False),
+    ]
     
     return app
 
@@ -125,6 +131,9 @@ app = create_app()
 
 if __name__ == "__main__":
     # 直接运行此文件时启动服务（仅用于开发测试）
+    # uvicorn只在此处使用，由ASGI服务器加载本模块时无需导入
+    import uvicorn
+
     uvicorn.run(
         "api.app:app",
         host="0.0.0.0",
@@ -0,0 +1,48 @@
+"""API端点公共工具"""
+
+import functools
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RouteFunc = TypeVar("RouteFunc", bound=Callable[..., Awaitable[Any]])
+
+
+@lru_cache(maxsize=1024)
+def parse_csv(value: Optional[str]) -> Tuple[str, ...]:
+    """解析逗号分隔的查询参数，结果缓存以便重复的筛选条件直接命中"""
+    if not value:
+        return ()
+    # 每个片段只strip一次，过滤和去空白都在C层完成
+    return tuple(filter(None, map(str.strip, value.split(","))))
+
+
+def handle_route_errors(message: str, status_code: int = 500, detail_prefix: str = ""):
+    """
+    路由异常处理装饰器
+
+    HTTPException原样抛出，其余异常记录日志后转换为指定状态码的HTTPException。
+    日志使用loguru的延迟格式化，只有在日志实际输出时才拼接异常信息。
+
+    Args:
+        message: 日志中的错误描述
+        status_code: 转换后的HTTP状态码
+        detail_prefix: 响应detail的前缀
+    """
+    def decorator(func: RouteFunc) -> RouteFunc:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error("{}: {}", message, e)
+                raise HTTPException(status_code=status_code, detail=f"{detail_prefix}{e}")
+        return wrapper
+    return decorator
@@ -1,29 +1,74 @@
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
-from loguru import logger
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from api.endpoints.common import handle_route_errors, parse_csv
+from api.middleware import cached_json_response
 from services.news_service import NewsService
 from database.base import get_db_session
+from utils.logger import get_logger
 
+logger = get_logger(__name__)
 router = APIRouter()
-news_service = NewsService()
+
+
+@lru_cache(maxsize=1)
+def _get_news_service() -> NewsService:
+    """首次使用时创建服务实例，避免模块导入时的初始化开销"""
+    return NewsService()
+
+
+@lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime:
+    """
+    解析时间查询参数，结果缓存以便分页请求复用相同的时间边界
+    
+    fromisoformat为C实现，兼容 "YYYY-MM-DD HH:MM:SS" 及 "T" 分隔格式；
+    格式错误时抛出ValueError（异常不会被缓存）
+    """
+    return datetime.fromisoformat(value)
 
 
 class NewsResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True, from_attributes=True)
+
     id: int
     title: str
-    desc: Optional[str] = None
-    url: Optional[str] = None
-    source: Optional[str] = None
-    news_type: Optional[str] = None
+    desc: Optional[str] = ""
+    url: Optional[str] = ""
+    source: Optional[str] = ""
+    news_type: Optional[str] = ""
     processing_status: str = "pending"
-    created_at: str = ""
-    updated_at: str = ""
+    created_at: Union[datetime, str] = ""
+    updated_at: Union[datetime, str] = ""
+
+    @field_validator("desc", "url", "source", "news_type", mode="before")
+    @classmethod
+    def _none_to_empty(cls, value):
+        """空值统一转换为空字符串"""
+        return value or ""
+
+    @field_validator("processing_status", mode="before")
+    @classmethod
+    def _default_status(cls, value):
+        """没有处理状态记录的新闻视为pending"""
+        return value or "pending"
+
+    @field_validator("created_at", "updated_at", mode="before")
+    @classmethod
+    def _empty_datetime(cls, value):
+        """时间字段保留datetime对象，由响应编码器统一序列化；空值转换为空字符串"""
+        return value or ""
 
 
 class NewsStatisticsResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     total_count: int
     processed_count: int
     pending_count: int
@@ -32,7 +77,44 @@ class NewsStatisticsResponse(BaseModel):
     by_source: dict
 
 
+def _news_payload(news: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    将服务层的新闻字典映射为响应字段（与NewsResponse结构一致）
+    
+    数据来自数据库，字段类型可信，不再逐字段校验；空值处理与模型上的校验器保持一致。
+    时间字段保留datetime对象，由orjson在C层直接格式化为ISO 8601字符串
+    """
+    return {
+        "id": news["id"],
+        "title": news["title"] or "",
+        "desc": news["desc"] or "",
+        "url": news["url"] or "",
+        "source": news["type"] or "",
+        "news_type": news["type"] or "",
+        "processing_status": news["processing_status"] or "pending",
+        "created_at": news["first_add_time"] or "",
+        "updated_at": news["last_update_time"] or ""
+    }
+
+
+async def _stream_news_json(news_rows: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """逐条编码新闻，按JSON数组分块输出，避免一次性构建整个响应体"""
+    yield b"["
+    prefix = b""
+    async for news in news_rows:
+        yield prefix + orjson.dumps(_news_payload(news))
+        prefix = b","
+    yield b"]"
+
+
+def _news_list_response(news_list: List[Dict[str, Any]]) -> Response:
+    """一次性编码为JSON字节，跳过FastAPI对返回值的二次校验和编码"""
+    body = orjson.dumps([_news_payload(news) for news in news_list])
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/unprocessed", response_model=List[NewsResponse])
+@handle_route_errors("获取未处理新闻失败")
 async def get_unprocessed_news(
     limit: int = Query(100, ge=1, le=1000, description="获取数量限制"),
     exclude_types: Optional[str] = Query(None, description="排除的新闻类型，逗号分隔"),
@@ -41,133 +123,97 @@ async def get_unprocessed_news(
     end_time: Optional[str] = Query(None, description="结束时间，格式：YYYY-MM-DD HH:MM:SS")
 ):
     """获取未处理的新闻"""
-    try:
-        exclude_list = exclude_types.split(",") if exclude_types else None
-        include_list = include_types.split(",") if include_types else None
-        
-        # 解析时间参数
-        start_datetime = None
-        end_datetime = None
-        if start_time:
-            try:
-                start_datetime = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                raise HTTPException(status_code=400, detail="开始时间格式错误，应为：YYYY-MM-DD HH:MM:SS")
-        
-        if end_time:
-            try:
-                end_datetime = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                raise HTTPException(status_code=400, detail="结束时间格式错误，应为：YYYY-MM-DD HH:MM:SS")
-        
-        news_list = await news_service.get_unprocessed_news(
-            limit=limit,
-            exclude_types=exclude_list,
-            include_types=include_list,
-            start_time=start_datetime,
-            end_time=end_datetime
-        )
-        
-        return [
-            NewsResponse(
-                id=news["id"],
-                title=news["title"],
-                desc=news.get("desc") or "",
-                url=news.get("url") or "",
-                source=news.get("source") or "",
-                news_type=news.get("news_type") or "",
-                processing_status=news.get("processing_status") or "pending",
-                created_at=news["created_at"].isoformat() if news.get("created_at") else "",
-                updated_at=news["updated_at"].isoformat() if news.get("updated_at") else ""
-            )
-            for news in news_list
-        ]
-        
-    except Exception as e:
-        logger.error(f"获取未处理新闻失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    exclude_list = parse_csv(exclude_types) or None
+    include_list = parse_csv(include_types) or None
+    
+    # 解析时间参数
+    start_datetime = None
+    end_datetime = None
+    if start_time:
+        try:
+            start_datetime = _parse_datetime(start_time)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="开始时间格式错误，应为：YYYY-MM-DD HH:MM:SS")
+    
+    if end_time:
+        try:
+            end_datetime = _parse_datetime(end_time)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="结束时间格式错误，应为：YYYY-MM-DD HH:MM:SS")
+    
+    # 分批读取、每批读完即归还数据库连接，数据直接流式写给客户端
+    news_rows = _get_news_service().stream_unprocessed_news(
+        limit=limit,
+        exclude_types=exclude_list,
+        include_types=include_list,
+        start_time=start_datetime,
+        end_time=end_datetime
+    )
+    
+    return StreamingResponse(_stream_news_json(news_rows), media_type="application/json")
 
 
 @router.get("/statistics", response_model=NewsStatisticsResponse)
-async def get_news_statistics():
-    """获取新闻统计信息"""
-    try:
-        stats = await news_service.get_news_statistics()
-        return NewsStatisticsResponse(**stats)
-    except Exception as e:
-        logger.error(f"获取新闻统计失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+@handle_route_errors("获取新闻统计失败")
+async def get_news_statistics(request: Request):
+    """获取新闻统计信息（服务层带短时缓存）"""
+    stats = await _get_news_service().get_news_statistics()
+    body = NewsStatisticsResponse(**stats).model_dump_json().encode()
+    return cached_json_response(request, body)
 
 
 @router.get("/recent", response_model=List[NewsResponse])
+@handle_route_errors("根据关键词获取新闻失败")
 async def get_recent_news_by_keywords(
     keywords: str = Query(..., description="关键词，逗号分隔"),
     limit: int = Query(50, ge=1, le=500, description="获取数量限制"),
     days: int = Query(7, ge=1, le=30, description="最近天数")
 ):
     """根据关键词获取最近的新闻"""
-    try:
-        keyword_list = [kw.strip() for kw in keywords.split(",") if kw.strip()]
-        if not keyword_list:
-            raise HTTPException(status_code=400, detail="关键词不能为空")
-        
-        news_list = await news_service.get_recent_news_by_keywords(
-            keywords=keyword_list,
-            limit=limit,
-            days=days
-        )
-        
-        return [
-            NewsResponse(
-                id=news["id"],
-                title=news["title"],
-                desc=news.get("desc") or "",
-                url=news.get("url") or "",
-                source=news.get("source") or "",
-                news_type=news.get("news_type") or "",
-                processing_status=news.get("processing_status") or "pending",
-                created_at=news["created_at"].isoformat() if news.get("created_at") else "",
-                updated_at=news["updated_at"].isoformat() if news.get("updated_at") else ""
-            )
-            for news in news_list
-        ]
-        
-    except Exception as e:
-        logger.error(f"根据关键词获取新闻失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    keyword_list = parse_csv(keywords)
+    if not keyword_list:
+        raise HTTPException(status_code=400, detail="关键词不能为空")
+    
+    news_list = await _get_news_service().get_recent_news_by_keywords(
+        keywords=keyword_list,
+        limit=limit,
+        days=days
+    )
+    
+    return _news_list_response(news_list)
 
 
 
 @router.patch("/status")
+@handle_route_errors("更新新闻状态失败")
 async def update_news_status(
     news_ids: List[int],
     stage: str = Query(..., description="处理阶段"),
     error_message: Optional[str] = Query(None, description="错误信息")
 ):
     """更新新闻处理状态"""
-    try:
-        if not news_ids:
-            raise HTTPException(status_code=400, detail="新闻ID列表不能为空")
-        
-        success = await news_service.update_news_status(
-            news_ids=news_ids,
-            stage=stage,
-            error_message=error_message
-        )
-        
-        return {
-            "message": f"成功更新 {len(news_ids)} 条新闻状态",
-            "success": success,
-            "stage": stage,
-            "news_count": len(news_ids)
-        }
-        
-    except Exception as e:
-        logger.error(f"更新新闻状态失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if not news_ids:
+        raise HTTPException(status_code=400, detail="新闻ID列表不能为空")
+    
+    success = await _get_news_service().update_news_status(
+        news_ids=news_ids,
+        stage=stage,
+        error_message=error_message
+    )
+    
+    return {
+        "message": f"成功更新 {len(news_ids)} 条新闻状态",
+        "success": success,
+        "stage": stage,
+        "news_count": len(news_ids)
+    }
+
+
+# 健康检查内容固定，导入时一次性序列化
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "news"})
 
 
 @router.get("/health")
 async def health_check():
     """健康检查"""
-    return {"status": "healthy", "service": "news"}
\ No newline at end of file
+    return Response(content=_HEALTH_BODY, media_type="application/json")
\ No newline at end of file
@@ -1,9 +1,17 @@
 """系统管理API端点"""
 
-from typing import Dict, Any
+import asyncio
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import text
 
+from api.endpoints.common import handle_route_errors
+from database import AsyncSessionLocal
 from services.news_service import NewsService
 from services.event_service import EventService
 from config import get_settings
@@ -12,8 +20,40 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 settings = get_settings()
-news_service = NewsService()
-event_service = EventService()
+
+
+# 数据库URL脱敏：隐藏用户名后的密码部分
+_DB_URL_MASK_RE = re.compile(r'://([^:]+):([^@]+)@')
+
+# 配置在进程生命周期内不变，相关取值在导入时一次性计算
+_AI_SERVICE_CONFIGURED = bool(
+    settings.openai_api_key and 
+    settings.openai_base_url and 
+    settings.openai_model
+)
+
+# 系统指标短时缓存，监控轮询在TTL内直接复用
+METRICS_CACHE_TTL = 5
+_metrics_cache: Optional[Dict[str, Any]] = None
+_metrics_expires_at = 0.0
+
+
+@lru_cache(maxsize=1)
+def _get_news_service() -> NewsService:
+    """首次使用时创建服务实例，避免模块导入时的初始化开销"""
+    return NewsService()
+
+
+@lru_cache(maxsize=1)
+def _get_event_service() -> EventService:
+    """首次使用时创建服务实例，避免模块导入时的初始化开销"""
+    return EventService()
+
+
+async def _check_database_connection() -> None:
+    """执行一次不经缓存的 SELECT 1，连接失败时抛出异常"""
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("SELECT 1"))
 
 
 class SystemStatusResponse(BaseModel):
@@ -37,226 +77,212 @@ class ConfigResponse(BaseModel):
 
 
 @router.get("/status", response_model=SystemStatusResponse)
+@handle_route_errors("获取系统状态失败")
 async def get_system_status():
     """获取系统状态"""
-    try:
-        # 检查数据库连接
-        database_connected = True
-        try:
-            await news_service.get_news_statistics()
-        except Exception as e:
-            logger.warning(f"数据库连接检查失败: {e}")
-            database_connected = False
-        
-        # 检查AI服务配置
-        ai_service_configured = bool(
-            settings.openai_api_key and 
-            settings.openai_base_url and 
-            settings.openai_model
-        )
-        
-        # 获取新闻统计
-        news_stats = {}
+    # 连接检查、新闻统计与最近事件数量相互独立，并发查询；
+    # 新闻统计走短时缓存，连接状态以不经缓存的 SELECT 1 为准
+    connection_result, news_result, events_result = await asyncio.gather(
+        _check_database_connection(),
+        _get_news_service().get_news_statistics(),
+        _get_event_service().count_recent_events(days=7),
+        return_exceptions=True
+    )
+    
+    database_connected = not isinstance(connection_result, Exception)
+    if not database_connected:
+        logger.warning(f"数据库连接检查失败: {connection_result}")
+    
+    news_stats = {}
+    if isinstance(news_result, Exception):
         if database_connected:
-            try:
-                news_stats = await news_service.get_news_statistics()
-            except Exception as e:
-                logger.warning(f"获取新闻统计失败: {e}")
-        
-        # 获取最近事件数量
-        recent_events_count = 0
+            logger.warning(f"获取新闻统计失败: {news_result}")
+    else:
+        news_stats = news_result
+    
+    recent_events_count = 0
+    if isinstance(events_result, Exception):
         if database_connected:
-            try:
-                recent_events = await event_service.get_recent_events(days=7, limit=1000)
-                recent_events_count = len(recent_events)
-            except Exception as e:
-                logger.warning(f"获取最近事件数量失败: {e}")
-        
-        from datetime import datetime
-        
-        return SystemStatusResponse(
-            status="healthy" if database_connected and ai_service_configured else "degraded",
-            version="1.0.0",
-            database_connected=database_connected,
-            ai_service_configured=ai_service_configured,
-            news_statistics=news_stats,
-            recent_events_count=recent_events_count,
-            timestamp=datetime.now().isoformat()
-        )
-        
-    except Exception as e:
-        logger.error(f"获取系统状态失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+            logger.warning(f"获取最近事件数量失败: {events_result}")
+    else:
+        recent_events_count = events_result
+    
+    return SystemStatusResponse(
+        status="healthy" if database_connected and _AI_SERVICE_CONFIGURED else "degraded",
+        version="1.0.0",
+        database_connected=database_connected,
+        ai_service_configured=_AI_SERVICE_CONFIGURED,
+        news_statistics=news_stats,
+        recent_events_count=recent_events_count,
+        timestamp=datetime.now().isoformat()
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_config_response() -> ConfigResponse:
+    """构建脱敏后的配置响应，首次请求时计算并缓存"""
+    # 脱敏数据库URL
+    db_url = settings.database_url
+    masked_url = _DB_URL_MASK_RE.sub(r'://\1:***@', db_url) if db_url else "未配置"
+    
+    return ConfigResponse(
+        database_url_masked=masked_url,
+        openai_model=settings.openai_model,
+        openai_base_url=settings.openai_base_url,
+        max_concurrent_requests=settings.max_concurrent_requests,
+        log_level=settings.log_level
+    )
 
 
 @router.get("/config", response_model=ConfigResponse)
 async def get_system_config():
     """获取系统配置（脱敏）"""
-    try:
-        # 脱敏数据库URL
-        db_url = settings.database_url
-        if db_url:
-            # 隐藏密码部分
-            import re
-            masked_url = re.sub(r'://([^:]+):([^@]+)@', r'://\1:***@', db_url)
-        else:
-            masked_url = "未配置"
-        
-        return ConfigResponse(
-            database_url_masked=masked_url,
-            openai_model=settings.openai_model,
-            openai_base_url=settings.openai_base_url,
-            max_concurrent_requests=settings.max_concurrent_requests,
-            log_level=settings.log_level
-        )
-        
-    except Exception as e:
-        logger.error(f"获取系统配置失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return _get_config_response()
 
 
 @router.post("/test/database")
+@handle_route_errors("数据库连接测试失败", status_code=503, detail_prefix="数据库连接失败: ")
 async def test_database_connection():
     """测试数据库连接"""
-    try:
-        # 尝试执行一个简单的数据库查询
-        stats = await news_service.get_news_statistics()
-        
-        return {
-            "success": True,
-            "message": "数据库连接正常",
-            "total_news": stats.get("total_count", 0),
-            "test_time": stats.get("updated_at")
-        }
-        
-    except Exception as e:
-        logger.error(f"数据库连接测试失败: {e}")
-        raise HTTPException(status_code=503, detail=f"数据库连接失败: {str(e)}")
+    # 尝试执行一个简单的数据库查询
+    stats = await _get_news_service().get_news_statistics(use_cache=False)
+    
+    return {
+        "success": True,
+        "message": "数据库连接正常",
+        "total_news": stats.get("total_count", 0),
+        "test_time": stats.get("updated_at")
+    }
 
 
 @router.post("/test/ai-service")
+@handle_route_errors("AI服务连接测试失败", status_code=503, detail_prefix="AI服务连接失败: ")
 async def test_ai_service():
     """测试AI服务连接"""
-    try:
-        from services.ai_service import AIService
-        
-        ai_service = AIService()
-        
-        # 发送测试消息
-        test_messages = [
-            {"role": "system", "content": "你是一个测试助手。"},
-            {"role": "user", "content": "请简单回复'测试成功'"}
-        ]
-        
-        response = await ai_service.chat_completion(test_messages)
-        
-        return {
-            "success": True,
-            "message": "AI服务连接正常",
-            "response": response.content,
-            "model": response.model,
-            "usage": response.usage
-        }
-        
-    except Exception as e:
-        logger.error(f"AI服务连接测试失败: {e}")
-        raise HTTPException(status_code=503, detail=f"AI服务连接失败: {str(e)}")
+    from services.ai_service import AIService
+    
+    ai_service = AIService()
+    
+    # 发送测试消息
+    test_messages = [
+        {"role": "system", "content": "你是一个测试助手。"},
+        {"role": "user", "content": "请简单回复'测试成功'"}
+    ]
+    
+    response = await ai_service.chat_completion(test_messages)
+    
+    return {
+        "success": True,
+        "message": "AI服务连接正常",
+        "response": response.content,
+        "model": response.model,
+        "usage": response.usage
+    }
 
 
 @router.get("/logs/recent")
+@handle_route_errors("获取日志失败")
 async def get_recent_logs(lines: int = 100):
     """获取最近的日志"""
-    try:
-        if lines < 1 or lines > 1000:
-            raise HTTPException(status_code=400, detail="日志行数必须在1-1000之间")
-        
-        # 这里可以实现读取日志文件的逻辑
-        # 暂时返回模拟数据
-        logs = [
-            {
-                "timestamp": "2024-01-01T12:00:00",
-                "level": "INFO",
-                "message": "系统启动成功",
-                "module": "main"
-            },
-            {
-                "timestamp": "2024-01-01T12:01:00",
-                "level": "INFO",
-                "message": "数据库连接成功",
-                "module": "database"
-            }
-        ]
-        
-        return {
-            "success": True,
-            "logs": logs,
-            "total_lines": len(logs),
-            "message": f"获取了最近 {len(logs)} 条日志"
+    if lines < 1 or lines > 1000:
+        raise HTTPException(status_code=400, detail="日志行数必须在1-1000之间")
+    
+    # 这里可以实现读取日志文件的逻辑
+    # 暂时返回模拟数据
+    logs = [
+        {
+            "timestamp": "2024-01-01T12:00:00",
+            "level": "INFO",
+            "message": "系统启动成功",
+            "module": "main"
+        },
+        {
+            "timestamp": "2024-01-01T12:01:00",
+            "level": "INFO",
+            "message": "数据库连接成功",
+            "module": "database"
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"获取日志失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    ]
+    
+    return {
+        "success": True,
+        "logs": logs,
+        "total_lines": len(logs),
+        "message": f"获取了最近 {len(logs)} 条日志"
+    }
 
 
 @router.post("/maintenance/cleanup")
+@handle_route_errors("数据清理失败")
 async def cleanup_old_data(days: int = 30):
     """清理旧数据"""
-    try:
-        if days < 7:
-            raise HTTPException(status_code=400, detail="保留天数不能少于7天")
-        
-        # 这里可以实现清理逻辑
-        # 比如删除过期的处理日志、临时数据等
-        
-        return {
-            "success": True,
-            "message": f"清理了 {days} 天前的旧数据",
-            "cleaned_items": {
-                "processing_logs": 0,
-                "temp_files": 0,
-                "cache_entries": 0
-            }
+    if days < 7:
+        raise HTTPException(status_code=400, detail="保留天数不能少于7天")
+    
+    # 这里可以实现清理逻辑
+    # 比如删除过期的处理日志、临时数据等
+    
+    return {
+        "success": True,
+        "message": f"清理了 {days} 天前的旧数据",
+        "cleaned_items": {
+            "processing_logs": 0,
+            "temp_files": 0,
+            "cache_entries": 0
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"数据清理失败: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    }
+
+
+def _collect_system_metrics() -> Dict[str, Any]:
+    """采集系统资源使用情况（同步阻塞调用）"""
+    import psutil
+    
+    # interval=None 返回距上次调用的CPU占用，不阻塞等待采样
+    cpu_percent = psutil.cpu_percent(interval=None)
+    memory = psutil.virtual_memory()
+    disk = psutil.disk_usage('/')
+    
+    return {
+        "system": {
+            "cpu_percent": cpu_percent,
+            "memory_percent": memory.percent,
+            "memory_used_gb": round(memory.used / (1024**3), 2),
+            "memory_total_gb": round(memory.total / (1024**3), 2),
+            "disk_percent": disk.percent,
+            "disk_used_gb": round(disk.used / (1024**3), 2),
+            "disk_total_gb": round(disk.total / (1024**3), 2)
+        },
+        "application": {
+            "uptime_seconds": time.time() - psutil.Process().create_time(),
+            "version": "1.0.0"
+        },
+        "timestamp": time.time()
+    }
+
+
+# 预先采样一次CPU占用，使第一次指标请求即可得到有效的差值
+try:
+    import psutil
+    psutil.cpu_percent(interval=None)
+except ImportError:
+    pass
 
 
 @router.get("/metrics")
 async def get_system_metrics():
     """获取系统指标"""
+    global _metrics_cache, _metrics_expires_at
+    
+    now = time.monotonic()
+    if _metrics_cache is not None and now < _metrics_expires_at:
+        return _metrics_cache
+    
     try:
-        import psutil
-        import time
-        
-        # 获取系统资源使用情况
-        cpu_percent = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        
-        metrics = {
-            "system": {
-                "cpu_percent": cpu_percent,
-                "memory_percent": memory.percent,
-                "memory_used_gb": round(memory.used / (1024**3), 2),
-                "memory_total_gb": round(memory.total / (1024**3), 2),
-                "disk_percent": disk.percent,
-                "disk_used_gb": round(disk.used / (1024**3), 2),
-                "disk_total_gb": round(disk.total / (1024**3), 2)
-            },
-            "application": {
-                "uptime_seconds": time.time() - psutil.Process().create_time(),
-                "version": "1.0.0"
-            },
-            "timestamp": time.time()
-        }
+        # psutil调用涉及系统调用和/proc读取，放到线程池执行，不占用事件循环
+        metrics = await asyncio.to_thread(_collect_system_metrics)
         
+        _metrics_cache = metrics
+        _metrics_expires_at = now + METRICS_CACHE_TTL
         return metrics
         
     except Exception as e:
@@ -0,0 +1,7 @@
+"""API中间件模块"""
+
+from .cors_asgi import FastCORS
+from .http_cache import cached_json_response
+from .static_json import StaticJSONEndpoint
+
+__all__ = ["FastCORS", "StaticJSONEndpoint", "cached_json_response"]
@@ -0,0 +1,116 @@
+"""纯ASGI实现的CORS中间件
+
+只实现 ``__call__(scope, receive, send)`` 协议，不经过Starlette的中间件包装链：
+- 预检请求（OPTIONS + Access-Control-Request-Method）直接返回204，不进入路由
+- 普通请求仅在 ``http.response.start`` 消息中追加预先编码好的CORS响应头
+"""
+
+from typing import Sequence
+
+# 预先编码的响应头，避免每个请求重复执行 str.encode / join
+ALLOW_ALL_ORIGINS_HEADER = (b"access-control-allow-origin", b"*")
+ALLOW_CREDENTIALS_HEADER = (b"access-control-allow-credentials", b"true")
+
+DEFAULT_ALLOW_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+DEFAULT_ALLOW_HEADERS = ("*",)
+DEFAULT_MAX_AGE = 86400
+
+ORIGIN_HEADER = b"origin"
+VARY_HEADER = b"vary"
+PREFLIGHT_REQUEST_HEADER = b"access-control-request-method"
+REQUEST_HEADERS_HEADER = b"access-control-request-headers"
+
+
+class FastCORS:
+    """轻量级CORS中间件（纯ASGI）"""
+
+    def __init__(
+        self,
+        app,
+        allow_methods: Sequence[str] = DEFAULT_ALLOW_METHODS,
+        allow_headers: Sequence[str] = DEFAULT_ALLOW_HEADERS,
+        allow_credentials: bool = False,
+        max_age: int = DEFAULT_MAX_AGE
+    ):
+        """
+        初始化中间件
+
+        Args:
+            app: 下游ASGI应用
+            allow_methods: 允许的请求方法
+            allow_headers: 允许的请求头，"*" 表示回显预检请求中声明的请求头
+            allow_credentials: 是否允许携带凭证（开启时回显请求的Origin而不是 "*"）
+            max_age: 浏览器缓存预检结果的秒数（Access-Control-Max-Age）
+        """
+        self.app = app
+        self.allow_credentials = allow_credentials
+        self._allow_all_headers = "*" in allow_headers
+        # 在初始化时一次性拼接并编码预检响应头
+        self._preflight_headers = [
+            (b"access-control-allow-methods", ",".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"content-length", b"0"),
+        ]
+        if not self._allow_all_headers:
+            self._preflight_headers.append(
+                (b"access-control-allow-headers", ",".join(allow_headers).encode("latin-1"))
+            )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = dict(scope.get("headers", ()))
+        origin = request_headers.get(ORIGIN_HEADER)
+
+        # 非跨域请求不追加CORS响应头
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # 预检请求直接短路返回，不调用下游应用
+        if scope["method"] == "OPTIONS" and PREFLIGHT_REQUEST_HEADER in request_headers:
+            headers = self._origin_headers(origin) + self._preflight_headers
+            vary = b"Origin"
+            requested_headers = request_headers.get(REQUEST_HEADERS_HEADER)
+            if self._allow_all_headers and requested_headers:
+                # 回显声明的请求头，响应随之变化，需要写入Vary
+                headers.append((b"access-control-allow-headers", requested_headers))
+                vary = b"Origin, Access-Control-Request-Headers"
+            headers.append((VARY_HEADER, vary))
+            await send({
+                "type": "http.response.start",
+                "status": 204,
+                "headers": headers,
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        cors_headers = self._origin_headers(origin)
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.extend(cors_headers)
+                self._append_vary_origin(headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    def _origin_headers(self, origin: bytes) -> list:
+        """允许来源相关的响应头；允许凭证时浏览器不接受 "*"，需回显请求的Origin"""
+        if self.allow_credentials:
+            return [(b"access-control-allow-origin", origin), ALLOW_CREDENTIALS_HEADER]
+        return [ALLOW_ALL_ORIGINS_HEADER]
+
+    @staticmethod
+    def _append_vary_origin(headers: list) -> None:
+        """在响应的Vary头中加入Origin，避免共享缓存把一个来源的响应返回给其他来源"""
+        for index, (name, value) in enumerate(headers):
+            if name.lower() == VARY_HEADER:
+                if b"origin" not in value.lower():
+                    headers[index] = (name, value + b", Origin")
+                return
+        headers.append((VARY_HEADER, b"Origin"))
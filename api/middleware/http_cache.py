@@ -0,0 +1,32 @@
+"""HTTP条件请求缓存工具
+
+为变化不频繁的统计类接口生成带 ``Cache-Control`` 和 ``ETag`` 的响应：
+- ETag 由序列化后的响应体计算，内容不变时保持不变
+- 客户端携带匹配的 ``If-None-Match`` 时直接返回304，不再传输响应体
+"""
+
+import hashlib
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+DEFAULT_MAX_AGE = 30
+
+
+def cached_json_response(request: Request, body: bytes, max_age: int = DEFAULT_MAX_AGE) -> Response:
+    """
+    根据已编码的JSON响应体构建可被客户端缓存的响应
+
+    Args:
+        request: 当前请求，用于读取If-None-Match
+        body: 已序列化的JSON字节
+        max_age: Cache-Control的max-age秒数
+
+    Returns:
+        命中ETag时返回304响应，否则返回带缓存头的JSON响应
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"Cache-Control": f"public, max-age={max_age}", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,39 @@
+"""纯ASGI实现的静态JSON端点
+
+用于健康检查、欢迎信息等内容固定的接口：
+- 响应体与响应头在初始化时一次性编码
+- 请求到达后直接写出缓存的字节，不经过依赖注入、参数解析和响应编码
+"""
+
+from typing import Any, Dict
+
+import orjson
+
+JSON_CONTENT_TYPE_HEADER = (b"content-type", b"application/json")
+
+
+class StaticJSONEndpoint:
+    """返回固定JSON内容的ASGI端点"""
+
+    def __init__(self, content: Dict[str, Any], status_code: int = 200):
+        """
+        初始化端点
+
+        Args:
+            content: 响应内容，初始化时序列化为字节
+            status_code: 响应状态码
+        """
+        self.body = orjson.dumps(content)
+        self.status_code = status_code
+        self._headers = [
+            JSON_CONTENT_TYPE_HEADER,
+            (b"content-length", str(len(self.body)).encode("latin-1")),
+        ]
+
+    async def __call__(self, scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self._headers,
+        })
+        await send({"type": "http.response.body", "body": self.body})
@@ -1,6 +1,23 @@
 """数据库模块"""
 
-from .connection import DatabaseManager, get_db_session
-from .base import Base
+from .connection import DatabaseManager, get_db_session, get_read_session
+from .base import Base, get_engine, get_async_engine, get_sessionmaker, get_async_sessionmaker
 
-__all__ = ["DatabaseManager", "get_db_session", "Base"]
\ No newline at end of file
+__all__ = [
+    "DatabaseManager",
+    "get_db_session",
+    "get_read_session",
+    "Base",
+    "AsyncSessionLocal",
+    "get_engine",
+    "get_async_engine",
+    "get_sessionmaker",
+    "get_async_sessionmaker",
+]
+
+
+def __getattr__(name: str):
+    # AsyncSessionLocal在首次访问时才创建异步引擎
+    if name == "AsyncSessionLocal":
+        return get_async_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,10 @@
 """数据库基础配置"""
 
+from functools import lru_cache
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -8,26 +12,89 @@ from config import get_settings
 
 settings = get_settings()
 
-# 创建数据库引擎
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-    pool_size=10,
-    max_overflow=20
-)
-
-# 创建会话工厂
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 # 创建基础模型类
 Base = declarative_base()
 
+
+# 同步与异步引擎共用的连接选项：
+# - 连接归还连接池时回滚未结束的事务（会话已正常结束事务时SQLAlchemy不会重复发送）
+# - 字符集显式指定，无需驱动协商
+_ENGINE_OPTIONS = {
+    "pool_reset_on_return": "rollback",
+    "connect_args": {"charset": "utf8mb4"},
+}
+
+
+# 引擎与会话工厂在首次使用时创建（进程内单例）：
+# 只导入模型的模块和不访问数据库的命令行模式不会加载数据库驱动、建立连接池
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """获取同步数据库引擎"""
+    # 使用由各连接参数组装的URL，DATABASE_URL解析出的参数在这里生效
+    return create_engine(
+        settings.database_url_sync,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        **_ENGINE_OPTIONS
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """
+    获取异步数据库引擎（aiomysql驱动）
+    
+    供API等异步路径复用连接池，查询期间不阻塞事件循环；每个进程持有自己的连接池
+    """
+    return create_async_engine(
+        settings.database_url_async,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        **_ENGINE_OPTIONS
+    )
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> sessionmaker:
+    """获取同步会话工厂"""
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker:
+    """获取异步会话工厂"""
+    return async_sessionmaker(get_async_engine(), class_=AsyncSession, expire_on_commit=False)
+
+
+# 兼容原有的模块级名称（engine、SessionLocal等），访问时才创建对应对象
+_LAZY_ATTRIBUTES = {
+    "engine": get_engine,
+    "async_engine": get_async_engine,
+    "SessionLocal": get_sessionmaker,
+    "AsyncSessionLocal": get_async_sessionmaker,
+}
+
+
+def __getattr__(name: str):
+    factory = _LAZY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
+
+
 # 数据库会话依赖
 def get_db_session():
     """获取数据库会话"""
-    db = SessionLocal()
+    db = get_sessionmaker()()
     try:
         yield db
     finally:
@@ -36,8 +103,5 @@ def get_db_session():
 # 异步获取数据库会话
 async def get_async_db_session():
     """异步获取数据库会话"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+    async with get_async_sessionmaker()() as session:
+        yield session
@@ -1,18 +1,25 @@
 """数据库连接管理"""
 
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Generator
 
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
-from .base import SessionLocal, engine, Base
+from .base import Base, get_async_sessionmaker, get_engine, get_sessionmaker
 from utils.logger import get_logger
 from utils.exceptions import DatabaseError
 
 logger = get_logger(__name__)
 
 
+def _reject_flush(session, flush_context, instances):
+    """只读会话的before_flush钩子：存在待写入的对象时直接报错，而不是在退出时静默丢弃"""
+    raise DatabaseError("只读会话不允许写入，请使用get_db_session")
+
+
 class DatabaseManager:
     """数据库管理器"""
     
@@ -20,7 +27,7 @@ class DatabaseManager:
     def create_tables():
         """创建所有表"""
         try:
-            Base.metadata.create_all(bind=engine)
+            Base.metadata.create_all(bind=get_engine())
             logger.info("数据库表创建成功")
         except SQLAlchemyError as e:
             logger.error(f"创建数据库表失败: {e}")
@@ -30,7 +37,7 @@ class DatabaseManager:
     def drop_tables():
         """删除所有表"""
         try:
-            Base.metadata.drop_all(bind=engine)
+            Base.metadata.drop_all(bind=get_engine())
             logger.info("数据库表删除成功")
         except SQLAlchemyError as e:
             logger.error(f"删除数据库表失败: {e}")
@@ -40,7 +47,7 @@ class DatabaseManager:
     @contextmanager
     def get_session() -> Generator[Session, None, None]:
         """获取数据库会话（上下文管理器）"""
-        session = SessionLocal()
+        session = get_sessionmaker()()
         try:
             yield session
             session.commit()
@@ -50,6 +57,26 @@ class DatabaseManager:
             raise DatabaseError(f"数据库操作失败: {e}")
         finally:
             session.close()
+    
+    @staticmethod
+    @contextmanager
+    def read_session() -> Generator[Session, None, None]:
+        """
+        获取只读数据库会话（上下文管理器）
+        
+        退出时不提交，关闭会话时回滚自动开启的事务（与COMMIT同为一次往返，并不更快）；
+        通过ORM新增、修改、删除对象会在flush时抛出DatabaseError，
+        但直接执行的UPDATE/INSERT语句无法拦截，会在退出时被回滚丢弃。需要写入时使用get_session
+        """
+        session = get_sessionmaker()()
+        event.listen(session, "before_flush", _reject_flush)
+        try:
+            yield session
+        except Exception as e:
+            logger.error(f"数据库查询失败: {e}")
+            raise DatabaseError(f"数据库查询失败: {e}")
+        finally:
+            session.close()
 
 
 # 便捷函数
@@ -57,10 +84,27 @@ def get_db_session():
     """获取数据库会话的便捷函数"""
     return DatabaseManager.get_session()
 
+def get_read_session():
+    """获取只读数据库会话的便捷函数"""
+    return DatabaseManager.read_session()
+
 def get_db():
     """获取数据库会话（兼容性函数）"""
     return DatabaseManager.get_session()
 
-async def get_async_db():
-    """异步获取数据库会话"""
-    return DatabaseManager.get_session()
\ No newline at end of file
+@asynccontextmanager
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    异步获取数据库会话（上下文管理器）
+    
+    基于aiomysql异步引擎，查询期间不阻塞事件循环；
+    与get_session语义一致：正常退出时提交，异常时回滚
+    """
+    async with get_async_sessionmaker()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"数据库操作失败: {e}")
+            raise DatabaseError(f"数据库操作失败: {e}")
\ No newline at end of file
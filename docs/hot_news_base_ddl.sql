@@ -17,5 +17,9 @@ CREATE TABLE `hot_news_base` (
   UNIQUE KEY `url_md5` (`url_md5`) USING BTREE,
   KEY `type` (`type`),
   KEY `first_add_time` (`first_add_time`),
-  KEY `last_update_time` (`last_update_time`)
-) ENGINE=InnoDB AUTO_INCREMENT=394685 DEFAULT CHARSET=utf8mb4 COMMENT='热点新闻基础信息表';
\ No newline at end of file
+  KEY `last_update_time` (`last_update_time`),
+  FULLTEXT KEY `ft_title_desc` (`title`,`desc`) /*!50100 WITH PARSER `ngram` */
+) ENGINE=InnoDB AUTO_INCREMENT=394685 DEFAULT CHARSET=utf8mb4 COMMENT='热点新闻基础信息表';
+
+-- 已有表补建全文索引（关键词检索依赖，scripts/create_missing_tables.py 会自动执行）：
+-- ALTER TABLE `hot_news_base` ADD FULLTEXT INDEX `ft_title_desc` (`title`, `desc`) WITH PARSER ngram;
@@ -4,74 +4,125 @@ import asyncio
 import signal
 import sys
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
-import uvicorn
-from fastapi import FastAPI
+# uvicorn、FastAPI应用和调度器都在实际用到的运行模式中再导入，
+# task/scheduler模式启动时不加载Web框架的整套依赖
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
-from config import get_settings
-from utils.logger import get_logger
-from scheduler import TaskScheduler
-from api.app import app
+# 配置与日志在解析完命令行参数后由_bootstrap加载，`--help`和参数错误时无需初始化
+logger = None
+settings = None
 
-logger = get_logger(__name__)
-settings = get_settings()
+
+def _bootstrap():
+    """加载配置并初始化日志（重复调用时直接返回）"""
+    global logger, settings
+    if logger is not None:
+        return
+    from config import get_settings
+    from utils.logger import get_logger
+    
+    settings = get_settings()
+    logger = get_logger(__name__)
 
 # 全局调度器实例
 scheduler = None
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(app: "FastAPI"):
     """应用生命周期管理"""
     global scheduler
+    from scheduler import TaskScheduler
     
     # 启动时执行
     logger.info("热榜聚合智能体启动中...")
     
+    # 初始化调度器并挂到应用状态上，任务管理接口复用同一个调度器实例
+    scheduler = TaskScheduler()
+    app.state.scheduler = scheduler
+    
+    # 调度器启动（含一次立即执行的数据处理）放到后台进行，
+    # 不阻塞uvicorn开始监听和处理请求
+    start_task = asyncio.create_task(scheduler.start())
+    start_task.add_done_callback(_log_scheduler_start)
+    
     try:
-        # 初始化并启动调度器
-        scheduler = TaskScheduler()
-        await scheduler.start()
-        logger.info("任务调度器启动成功")
-        
         yield
-        
-    except Exception as e:
-        logger.error(f"应用启动失败: {e}")
-        raise
     
     finally:
         # 关闭时执行
         logger.info("热榜聚合智能体关闭中...")
         
-        if scheduler:
-            await scheduler.stop()
-            logger.info("任务调度器已停止")
+        # 启动尚未完成时（通常是首次数据处理仍在进行）直接取消
+        if not start_task.done():
+            start_task.cancel()
+        await asyncio.gather(start_task, return_exceptions=True)
+        
+        await scheduler.stop()
+        logger.info("任务调度器已停止")
         
         logger.info("热榜聚合智能体已关闭")
 
 
-# 设置应用生命周期
-app.router.lifespan_context = lifespan
+def _log_scheduler_start(task: asyncio.Task):
+    """记录后台调度器启动的结果"""
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error(f"任务调度器启动失败: {error}")
+    else:
+        logger.info("任务调度器启动成功")
 
 
-def signal_handler(signum, frame):
-    """信号处理器"""
-    logger.info(f"接收到信号 {signum}，准备关闭应用...")
-    sys.exit(0)
+def _get_app() -> "FastAPI":
+    """导入API应用并设置带调度器的生命周期"""
+    _bootstrap()
+    from api.app import app
+    
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def __getattr__(name: str):
+    """兼容 `uvicorn main:app`：首次访问app属性时才导入API应用"""
+    if name == "app":
+        return _get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _cancel_on_sigterm():
+    """
+    收到SIGTERM时取消当前主任务
+    
+    与Ctrl+C（asyncio.run自身的SIGINT处理）一样以取消的方式退出，
+    finally中的调度器停止等清理逻辑得以执行；Windows事件循环不支持时跳过
+    """
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, task.cancel)
+    except NotImplementedError:
+        pass
 
 
 async def run_api_server():
     """运行API服务器"""
+    import uvicorn
+    
     try:
         logger.info("启动API服务器...")
         
         config = uvicorn.Config(
-            app=app,
+            app=_get_app(),
             host=settings.api_host,
             port=settings.api_port,
-            log_level=settings.log_level.lower(),
-            access_log=True,
+            log_level=settings.log_level_lower,
+            # 访问日志对每个请求都要格式化并写出，默认关闭，排查问题时通过API_ACCESS_LOG开启
+            access_log=settings.api_access_log,
             reload=False  # 生产环境不使用reload
         )
         
@@ -86,6 +137,7 @@ async def run_api_server():
 async def run_scheduler_only():
     """仅运行调度器（不启动API服务器）"""
     global scheduler
+    from scheduler import TaskScheduler
     
     try:
         logger.info("启动调度器模式...")
@@ -95,12 +147,13 @@ async def run_scheduler_only():
         await scheduler.start()
         
         logger.info("调度器启动成功，按 Ctrl+C 停止")
+        _cancel_on_sigterm()
         
-        # 保持运行
+        # 保持运行：等待一个不会被设置的事件，空闲时不再周期性唤醒事件循环，
+        # 收到SIGINT/SIGTERM时主任务被取消，等待随之结束
         try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
             logger.info("接收到停止信号")
         
     except Exception as e:
@@ -115,6 +168,7 @@ async def run_scheduler_only():
 async def run_single_task(task_name: str):
     """运行单个任务"""
     global scheduler
+    from scheduler import TaskScheduler
     
     try:
         logger.info(f"执行单个任务: {task_name}")
@@ -133,49 +187,54 @@ async def run_single_task(task_name: str):
         raise
 
 
-def main():
-    """主函数"""
+# 运行模式 -> (启动日志模板, 创建主协程的函数)
+_MODES = {
+    "api": ("启动API服务器模式", lambda args: run_api_server()),
+    "scheduler": ("启动调度器模式", lambda args: run_scheduler_only()),
+    "task": ("启动单个任务模式: {task}", lambda args: run_single_task(args.task)),
+}
+_TASK_NAMES = ("data_processing", "event_combine")
+
+
+def _parse_args():
+    """解析命令行参数（不依赖配置和日志）"""
     import argparse
     
     parser = argparse.ArgumentParser(description="热榜聚合智能体")
     parser.add_argument(
         "--mode",
-        choices=["api", "scheduler", "task"],
+        choices=list(_MODES),
         default="api",
         help="运行模式: api(API服务器), scheduler(仅调度器), task(单个任务)"
     )
     parser.add_argument(
         "--task",
-        choices=["data_processing", "event_combine"],
+        choices=_TASK_NAMES,
         help="任务名称（仅在task模式下使用）"
     )
     
     args = parser.parse_args()
+    if args.mode == "task" and not args.task:
+        parser.error("task模式需要指定--task参数")
+    return args
+
+
+def main():
+    """主函数"""
+    args = _parse_args()
+    _bootstrap()
     
-    # 注册信号处理器
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # 不注册全局信号处理器：API模式由uvicorn处理SIGINT/SIGTERM并执行生命周期关闭，
+    # 其余模式由asyncio.run取消主任务，清理逻辑都能正常执行
     
+    message, make_coroutine = _MODES[args.mode]
     try:
+        logger.info(message.format(task=args.task))
         if args.mode == "api":
-            # API服务器模式
-            logger.info("启动API服务器模式")
-            asyncio.run(run_api_server())
-            
-        elif args.mode == "scheduler":
-            # 仅调度器模式
-            logger.info("启动调度器模式")
-            asyncio.run(run_scheduler_only())
-            
-        elif args.mode == "task":
-            # 单个任务模式
-            if not args.task:
-                logger.error("task模式需要指定--task参数")
-                sys.exit(1)
-            
-            logger.info(f"启动单个任务模式: {args.task}")
-            asyncio.run(run_single_task(args.task))
-            
+            from utils.async_utils import install_uvloop
+            install_uvloop()
+        asyncio.run(make_coroutine(args))
+        
     except KeyboardInterrupt:
         logger.info("程序被用户中断")
     except Exception as e:
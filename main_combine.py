@@ -7,23 +7,46 @@
 import asyncio
 import sys
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from loguru import logger
-from config.settings import settings
-from services.event_combine_service import event_combine_service
+
+# 配置和合并服务在用到时导入，help等不执行流程的模式无需加载配置和数据库
+
+
+# 正在执行的合并流程，并发触发的调用共享同一次执行结果
+_inflight_combine: Optional[asyncio.Future] = None
 
 
 async def run_combine_process(show_progress: bool = True) -> dict:
     """
     执行事件合并流程
 
+    合并流程不接收参数，执行期间再次触发（如定时任务与手动触发重叠）时
+    直接等待正在执行的流程结果，避免重复调用LLM和对同一批事件重复合并
+
     Args:
         show_progress: 是否显示进度
 
     Returns:
         dict: 处理结果
     """
+    global _inflight_combine
+
+    if _inflight_combine is None or _inflight_combine.done():
+        _inflight_combine = asyncio.ensure_future(_run_combine_process())
+    else:
+        logger.info("已有事件合并流程正在执行，等待其结果")
+
+    # shield: 单个调用方被取消时不影响其他等待同一结果的调用方
+    return await asyncio.shield(_inflight_combine)
+
+
+async def _run_combine_process() -> dict:
+    """执行一次完整的事件合并流程并输出统计"""
+    from config.settings import settings
+    from services.event_combine_service import event_combine_service
+
     logger.info("=" * 60)
     logger.info("开始执行事件合并主流程")
     logger.info("=" * 60)
@@ -125,17 +148,43 @@ async def run_manual_combine(event_ids: list) -> dict:
             'failed_count': 1
         }
 
+    from services.event_combine_service import event_combine_service
+
     # 执行手动合并流程
     return await event_combine_service.run_manual_combine_process(event_ids)
 
 
+def parse_event_ids(value: str) -> List[int]:
+    """
+    解析手动合并的事件ID参数
+
+    Args:
+        value: 逗号分隔的事件ID，或 @文件路径（文件中的ID以逗号或空白分隔）
+
+    Returns:
+        List[int]: 事件ID列表，保持输入顺序
+
+    Raises:
+        ValueError: 存在非数字的ID
+        OSError: 文件读取失败
+    """
+    if value.startswith('@'):
+        with open(value[1:], encoding='utf-8') as f:
+            return list(map(int, f.read().replace(',', ' ').split()))
+    # int()会忽略首尾空白
+    return list(map(int, value.split(',')))
+
+
 def show_usage():
     """显示使用说明"""
     print("""
 热榜聚合系统事件合并处理器
 
 使用方法:
-    python main_combine.py [模式] [参数]
+    python main_combine.py [模式] [参数] [-y|--yes]
+
+选项:
+    -y, --yes    跳过执行前的确认（适合脚本和定时任务调用）
 
 支持的模式:
     incremental  - 增量合并（默认）
@@ -163,19 +212,21 @@ def show_usage():
     python main_combine.py incremental       # 增量合并
     python main_combine.py daily             # 每日合并
     python main_combine.py custom            # 自定义合并（需确认）
+    python main_combine.py custom --yes      # 自定义合并（跳过确认）
 
 手动合并示例:
     python main_combine.py manual 367,397           # 合并事件367和397
     python main_combine.py manual 367,397,400       # 合并多个事件（367,397,400）
     python main_combine.py manual 1001,1002,1003    # 合并指定的3个事件
+    python main_combine.py manual @event_ids.txt    # 从文件读取事件ID（逗号或空白分隔）
 
 手动合并说明:
-    - 格式：python main_combine.py manual <事件ID1>,<事件ID2>[,<事件ID3>...]
+    - 格式：python main_combine.py manual <事件ID1>,<事件ID2>[,<事件ID3>...] 或 manual @<文件路径>
     - 第一个事件ID将作为主事件（保留），其他事件将合并到主事件
     - 至少需要2个事件ID，支持合并任意多个事件
     - 跳过LLM相似性分析，直接执行合并操作
     - 适用场景：测试、手动纠正、批量处理特定事件组合
-    - 执行前会显示确认信息，需要用户确认后才执行
+    - 执行前会显示确认信息，需要用户确认后才执行（--yes 跳过确认）
 
 注意事项:
     - 警告：事件合并是不可逆操作，请谨慎使用
@@ -187,11 +238,31 @@ def show_usage():
     """)
 
 
+async def confirm_execution(assume_yes: bool) -> bool:
+    """
+    询问用户是否确认执行
+
+    在线程中等待输入，不阻塞事件循环
+
+    Args:
+        assume_yes: 是否跳过确认（--yes）
+
+    Returns:
+        bool: 是否确认执行
+    """
+    if assume_yes:
+        return True
+    confirm = await asyncio.to_thread(input, "确认执行吗？(y/N): ")
+    return confirm.strip().lower() in ['y', 'yes']
+
+
 async def main():
     """主函数"""
     try:
-        # 获取命令行参数
-        mode = sys.argv[1] if len(sys.argv) > 1 else "incremental"
+        # 获取命令行参数，-y/--yes 可出现在任意位置
+        args = [arg for arg in sys.argv[1:] if arg not in ('-y', '--yes')]
+        assume_yes = len(args) != len(sys.argv) - 1
+        mode = args[0] if args else "incremental"
 
         if mode == "help" or mode == "-h" or mode == "--help":
             show_usage()
@@ -203,27 +274,28 @@ async def main():
         elif mode == "daily":
             result = await run_daily_combine()
         elif mode == "custom":
+            from services.event_combine_service import event_combine_service
+
             # 自定义模式运行
             print("自定义模式：将分析所有配置范围内的事件，发现合并建议就执行")
             print(f"当前配置：分析 {event_combine_service.combine_count} 个事件，置信度阈值 {event_combine_service.confidence_threshold}")
 
-            confirm = input("确认执行吗？(y/N): ").strip().lower()
-            if confirm not in ['y', 'yes']:
+            if not await confirm_execution(assume_yes):
                 logger.info("用户取消执行")
                 return
 
             result = await run_custom_combine()
         elif mode == "manual":
             # 手动指定事件ID合并
-            if len(sys.argv) < 3:
+            if len(args) < 2:
                 logger.error("manual 模式需要指定事件ID列表")
                 print("使用方法: python main_combine.py manual 367,397,400")
                 return
 
             # 解析事件ID列表
-            event_ids_str = sys.argv[2]
+            event_ids_str = args[1]
             try:
-                event_ids = [int(id_str.strip()) for id_str in event_ids_str.split(',')]
+                event_ids = parse_event_ids(event_ids_str)
                 logger.info(f"解析事件ID列表: {event_ids}")
 
                 # 显示确认信息
@@ -231,12 +303,14 @@ async def main():
                 print(f"主事件ID: {event_ids[0]} (第一个ID将作为主事件)")
                 print("注意：这是不可逆操作，将直接执行合并而不通过LLM分析")
 
-                confirm = input("确认执行吗？(y/N): ").strip().lower()
-                if confirm not in ['y', 'yes']:
+                if not await confirm_execution(assume_yes):
                     logger.info("用户取消执行")
                     return
 
                 result = await run_manual_combine(event_ids)
+            except OSError as e:
+                logger.error(f"读取事件ID文件失败: {e}")
+                return
             except ValueError as e:
                 logger.error(f"解析事件ID失败: {e}")
                 print("事件ID必须是数字，用逗号分隔，例如：367,397,400")
@@ -265,4 +339,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # help模式不导入utils（会加载配置），只打印使用说明
+    if sys.argv[1:2] not in (["help"], ["-h"], ["--help"]):
+        from utils.async_utils import install_uvloop
+        install_uvloop()
     asyncio.run(main())
\ No newline at end of file
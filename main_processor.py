@@ -6,12 +6,13 @@
 
 import asyncio
 import sys
+import time
 from datetime import datetime, timedelta
 from typing import Optional, List, Union
 
 from loguru import logger
-from config.settings import settings
-from services.event_aggregation_service import event_aggregation_service
+
+# 配置、服务和utils（会加载配置）均在用到时导入，help等不执行流程的模式无需加载配置和数据库
 
 
 async def run_full_process(
@@ -36,6 +37,9 @@ async def run_full_process(
     logger.info("开始执行事件聚合主流程")
     logger.info("=" * 60)
     
+    from config.settings import settings
+    from services.event_aggregation_service import event_aggregation_service
+    
     # 格式化新闻类型显示
     if isinstance(news_type, list):
         news_type_display = f"[{', '.join(news_type)}]"
@@ -49,11 +53,26 @@ async def run_full_process(
     logger.info(f"  批处理大小: {settings.EVENT_AGGREGATION_BATCH_SIZE}")
     logger.info(f"  并发数: {settings.EVENT_AGGREGATION_MAX_CONCURRENT}")
     
-    # 进度回调函数
+    # 进度回调函数：按已完成批次数计算进度（批次并发执行，完成顺序与批次序号无关），
+    # 每秒最多输出一次或进度每推进5%输出一次，全部批次完成时总是输出
+    completed_batches = 0
+    last_emit_time = 0.0
+    last_emit_progress = 0.0
+    
     def progress_callback(current_batch: int, total_batches: int, batch_size: int):
-        if show_progress:
-            progress = (current_batch / total_batches) * 100
-            logger.info(f"处理进度: {current_batch}/{total_batches} 批次 ({progress:.1f}%), 当前批次大小: {batch_size}")
+        nonlocal completed_batches, last_emit_time, last_emit_progress
+        if not show_progress:
+            return
+        completed_batches += 1
+        progress = (completed_batches / total_batches) * 100
+        now = time.monotonic()
+        if (completed_batches < total_batches
+                and now - last_emit_time < 1.0
+                and progress - last_emit_progress < 5):
+            return
+        last_emit_time = now
+        last_emit_progress = progress
+        logger.info(f"处理进度: {completed_batches}/{total_batches} 批次 ({progress:.1f}%), 刚完成第 {current_batch} 批次，批次大小: {batch_size}")
     
     try:
         # 执行聚合流程
@@ -168,11 +187,13 @@ async def run_custom_process(
     Returns:
         dict: 处理结果
     """
+    from utils.datetime_utils import parse_datetime
+    
     logger.info(f"开始自定义时间范围处理: {start_time} ~ {end_time}")
     
     try:
-        start_dt = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        end_dt = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
+        start_dt = parse_datetime(start_time)
+        end_dt = parse_datetime(end_time)
     except ValueError as e:
         logger.error(f"时间格式错误: {e}")
         return {
@@ -243,9 +264,10 @@ async def main():
         elif mode == "custom":
             # 交互式输入时间范围
             print("请输入时间范围:")
-            start_time = input("开始时间 (YYYY-MM-DD HH:MM:SS): ")
-            end_time = input("结束时间 (YYYY-MM-DD HH:MM:SS): ")
-            news_type_input = input("新闻类型 (可选，多个类型用逗号分隔，直接回车跳过): ").strip()
+            # 在线程中等待输入，不阻塞事件循环
+            start_time = await asyncio.to_thread(input, "开始时间 (YYYY-MM-DD HH:MM:SS): ")
+            end_time = await asyncio.to_thread(input, "结束时间 (YYYY-MM-DD HH:MM:SS): ")
+            news_type_input = (await asyncio.to_thread(input, "新闻类型 (可选，多个类型用逗号分隔，直接回车跳过): ")).strip()
             
             # 处理新闻类型输入
             news_type = None
@@ -278,4 +300,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # help模式不导入utils（会加载配置），只打印使用说明
+    if sys.argv[1:2] not in (["help"], ["-h"], ["--help"]):
+        from utils.async_utils import install_uvloop
+        install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -52,14 +52,14 @@ class Event(Base):
         Index('idx_priority', 'priority'),
         Index('idx_status', 'status'),
         Index('idx_created_at', 'created_at'),
-        Index('idx_updated_at', 'updated_at'),
         Index('idx_hot_score', 'hot_score'),
         Index('idx_start_time', 'start_time'),
         Index('idx_confidence', 'confidence'),
-        Index('idx_auto_generated', 'auto_generated'),
-        Index('idx_reviewed', 'reviewed'),
         Index('idx_merged_to', 'merged_to'),
-        Index('idx_title', 'title'),
+        # 已移除：idx_title（标题仅做LIKE '%关键词%'检索，用不到B树索引）、
+        # idx_auto_generated/idx_reviewed（0/1两值列，选择性过低）、idx_updated_at（无按更新时间的查询）
+        # 已有表：ALTER TABLE events_new DROP INDEX idx_title, DROP INDEX idx_auto_generated,
+        #         DROP INDEX idx_reviewed, DROP INDEX idx_updated_at;
     )
 
     def __repr__(self):
@@ -1,10 +1,10 @@
 """事件相关数据模型"""
 
-from datetime import datetime
 from typing import Optional, Dict, Any
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, DECIMAL
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from database.base import Base
 
@@ -27,8 +27,8 @@ class Event(Base):
     first_news_time = Column(DateTime, comment="最早新闻时间")
     last_news_time = Column(DateTime, comment="最新新闻时间")
     status = Column(Integer, default=1, comment="状态：1-正常，2-已合并，3-已删除")
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="创建时间")
-    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, comment="更新时间")
+    created_at = Column(DateTime, nullable=False, default=func.now(), comment="创建时间")
+    updated_at = Column(DateTime, nullable=False, default=func.now(), onupdate=func.now(), comment="更新时间")
     
     # 关系
     news_relations = relationship("NewsEventRelation", back_populates="event")
@@ -50,7 +50,7 @@ class NewsEventRelation(Base):
     event_id = Column(Integer, ForeignKey("hot_aggr_events.id", ondelete="CASCADE"), nullable=False, comment="事件ID")
     confidence_score = Column(DECIMAL(5, 4), comment="关联置信度分数")
     relation_type = Column(String(20), default="primary", comment="关联类型")
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="创建时间")
+    created_at = Column(DateTime, nullable=False, default=func.now(), comment="创建时间")
     
     # 关系
     news = relationship("HotNewsBase", back_populates="event_relations")
@@ -71,7 +71,7 @@ class EventLabel(Base):
     label_value = Column(String(255), nullable=False, comment="标签值")
     confidence = Column(DECIMAL(5, 4), comment="标签置信度")
     source = Column(String(50), default="ai", comment="标签来源")
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="创建时间")
+    created_at = Column(DateTime, nullable=False, default=func.now(), comment="创建时间")
     
     # 关系
     event = relationship("Event", back_populates="labels")
@@ -91,7 +91,7 @@ class EventHistoryRelation(Base):
     relation_type = Column(String(50), nullable=False, comment="关联类型")
     confidence_score = Column(DECIMAL(5, 4), comment="关联置信度")
     description = Column(Text, comment="关联描述")
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, comment="创建时间")
+    created_at = Column(DateTime, nullable=False, default=func.now(), comment="创建时间")
     
     # 关系
     parent_event = relationship("Event", foreign_keys=[parent_event_id], back_populates="child_relations")
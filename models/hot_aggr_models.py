@@ -23,7 +23,8 @@ class HotAggrEvent(Base):
     entities = Column(Text, comment='实体信息JSON：人物、组织、地点等')
     regions = Column(Text, comment='地域信息JSON：国家、省份、城市等')
     keywords = Column(Text, comment='关键词JSON数组')
-    confidence_score = Column(DECIMAL(5, 4), comment='聚合置信度分数')
+    # asdecimal=False：读取时直接得到float而非Decimal（业务中均按float使用，orjson也不能序列化Decimal），下同
+    confidence_score = Column(DECIMAL(5, 4, asdecimal=False), comment='聚合置信度分数')
     news_count = Column(Integer, default=0, comment='关联新闻数量')
     first_news_time = Column(DateTime, comment='最早新闻时间')
     last_news_time = Column(DateTime, comment='最新新闻时间')
@@ -34,7 +35,10 @@ class HotAggrEvent(Base):
     __table_args__ = (
         Index('idx_event_type', 'event_type'),
         Index('idx_sentiment', 'sentiment'),
-        Index('idx_status', 'status'),
+        # 事件合并候选查询：WHERE status = 1 ORDER BY created_at DESC LIMIT n，
+        # 复合索引可直接按序取前n条，并覆盖仅按status过滤的查询（替代原idx_status）
+        # 已有表：ALTER TABLE hot_aggr_events ADD INDEX idx_status_created_at (status, created_at), DROP INDEX idx_status;
+        Index('idx_status_created_at', 'status', 'created_at'),
         Index('idx_created_at', 'created_at'),
         Index('idx_first_news_time', 'first_news_time'),
     )
@@ -94,7 +98,7 @@ class HotAggrNewsEventRelation(Base):
     id = Column(Integer, primary_key=True, autoincrement=True, comment='关联主键')
     news_id = Column(Integer, nullable=False, comment='新闻ID，关联hot_news_base.id')
     event_id = Column(Integer, nullable=False, comment='事件ID，关联hot_aggr_events.id')
-    confidence_score = Column(DECIMAL(5, 4), comment='关联置信度分数')
+    confidence_score = Column(DECIMAL(5, 4, asdecimal=False), comment='关联置信度分数')
     relation_type = Column(String(20), default='primary', comment='关联类型：primary-主要，secondary-次要')
     created_at = Column(DateTime, nullable=False, default=func.now(), comment='创建时间')
 
@@ -117,7 +121,7 @@ class HotAggrEventLabel(Base):
     event_id = Column(Integer, nullable=False, comment='事件ID，关联hot_aggr_events.id')
     label_type = Column(String(50), nullable=False, comment='标签类型：sentiment、entity、region、category等')
     label_value = Column(String(255), nullable=False, comment='标签值')
-    confidence = Column(DECIMAL(5, 4), comment='标签置信度')
+    confidence = Column(DECIMAL(5, 4, asdecimal=False), comment='标签置信度')
     source = Column(String(50), default='ai', comment='标签来源：ai、manual、rule')
     created_at = Column(DateTime, nullable=False, default=func.now(), comment='创建时间')
 
@@ -140,7 +144,7 @@ class HotAggrEventHistoryRelation(Base):
     parent_event_id = Column(Integer, nullable=False, comment='父事件ID')
     child_event_id = Column(Integer, nullable=False, comment='子事件ID')
     relation_type = Column(String(50), nullable=False, comment='关联类型：continuation-延续，evolution-演化，merge-合并')
-    confidence_score = Column(DECIMAL(5, 4), comment='关联置信度')
+    confidence_score = Column(DECIMAL(5, 4, asdecimal=False), comment='关联置信度')
     description = Column(Text, comment='关联描述')
     created_at = Column(DateTime, nullable=False, default=func.now(), comment='创建时间')
 
@@ -9,6 +9,20 @@ from sqlalchemy.sql import func
 from database.base import Base
 
 
+def _parse_time_field(value: Any) -> Optional[datetime]:
+    """
+    转换from_dict中的时间字段：字符串按ISO格式解析，解析失败或为空时返回None，其余原样返回
+    
+    Python 3.11起fromisoformat直接支持"Z"后缀和空格分隔，无需预先替换
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value or None
+
+
 class HotNewsBase(Base):
     """热点新闻基础表模型（匹配实际表结构）"""
     __tablename__ = 'hot_news_base'
@@ -34,6 +48,8 @@ class HotNewsBase(Base):
         Index('type', 'type'),
         Index('first_add_time', 'first_add_time'),
         Index('last_update_time', 'last_update_time'),
+        # 中文标题与摘要的全文索引，供关键词检索使用（ngram分词）
+        Index('ft_title_desc', 'title', 'desc', mysql_prefix='FULLTEXT', mysql_with_parser='ngram'),
     )
 
     def __repr__(self):
@@ -66,41 +82,8 @@ class HotNewsBase(Base):
     def from_dict(cls, data: Dict[str, Any]) -> 'HotNewsBase':
         """从字典创建实例"""
         # 处理时间字段
-        first_add_time = None
-        if data.get('first_add_time'):
-            if isinstance(data['first_add_time'], str):
-                try:
-                    first_add_time = datetime.fromisoformat(data['first_add_time'].replace('Z', '+00:00'))
-                except ValueError:
-                    first_add_time = None
-            else:
-                first_add_time = data['first_add_time']
-        elif data.get('add_time'):  # 兼容性处理
-            if isinstance(data['add_time'], str):
-                try:
-                    first_add_time = datetime.fromisoformat(data['add_time'].replace('Z', '+00:00'))
-                except ValueError:
-                    first_add_time = None
-            else:
-                first_add_time = data['add_time']
-        
-        last_update_time = None
-        if data.get('last_update_time'):
-            if isinstance(data['last_update_time'], str):
-                try:
-                    last_update_time = datetime.fromisoformat(data['last_update_time'].replace('Z', '+00:00'))
-                except ValueError:
-                    last_update_time = None
-            else:
-                last_update_time = data['last_update_time']
-        elif data.get('update_time'):  # 兼容性处理
-            if isinstance(data['update_time'], str):
-                try:
-                    last_update_time = datetime.fromisoformat(data['update_time'].replace('Z', '+00:00'))
-                except ValueError:
-                    last_update_time = None
-            else:
-                last_update_time = data['update_time']
+        first_add_time = _parse_time_field(data.get('first_add_time') or data.get('add_time'))  # 兼容add_time字段
+        last_update_time = _parse_time_field(data.get('last_update_time') or data.get('update_time'))  # 兼容update_time字段
         
         return cls(
             type=data.get('type'),
@@ -159,35 +142,9 @@ class NewsProcessingStatus(Base):
     def from_dict(cls, data: Dict[str, Any]) -> 'NewsProcessingStatus':
         """从字典创建实例"""
         # 处理时间字段
-        last_processed_at = None
-        if data.get('last_processed_at'):
-            if isinstance(data['last_processed_at'], str):
-                try:
-                    last_processed_at = datetime.fromisoformat(data['last_processed_at'].replace('Z', '+00:00'))
-                except ValueError:
-                    last_processed_at = None
-            else:
-                last_processed_at = data['last_processed_at']
-        
-        created_at = None
-        if data.get('created_at'):
-            if isinstance(data['created_at'], str):
-                try:
-                    created_at = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
-                except ValueError:
-                    created_at = None
-            else:
-                created_at = data['created_at']
-        
-        updated_at = None
-        if data.get('updated_at'):
-            if isinstance(data['updated_at'], str):
-                try:
-                    updated_at = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
-                except ValueError:
-                    updated_at = None
-            else:
-                updated_at = data['updated_at']
+        last_processed_at = _parse_time_field(data.get('last_processed_at'))
+        created_at = _parse_time_field(data.get('created_at'))
+        updated_at = _parse_time_field(data.get('updated_at'))
         
         return cls(
             news_id=data.get('news_id'),
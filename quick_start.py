@@ -158,7 +158,7 @@ def show_help():
 
 🔧 配置文件:
 - .env: 系统环境配置
-- config/settings_new.py: 详细配置参数
+- config/settings.py: 详细配置参数
 
 📁 重要文件:
 - main_processor.py: 主处理器
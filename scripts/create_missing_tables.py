@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
-创建缺失的数据库表
-主要解决事件合并时需要的 hot_aggr_event_history_relations 表
+创建缺失的数据库表和索引
+主要解决事件合并时需要的 hot_aggr_event_history_relations 表，
+以及关键词检索依赖的 hot_news_base 全文索引 ft_title_desc
 """
 
 import sys
@@ -12,26 +13,66 @@ from loguru import logger
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import create_engine, text
+from typing import Iterable, Set
+
+from sqlalchemy import bindparam, create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 from config.settings import settings
 from models.hot_aggr_models import HotAggrEventHistoryRelation, Base
 from database.base import engine
 
+# 已有表上需要补建的索引：(表名, 索引名, 建索引语句)
+REQUIRED_INDEXES = [
+    (
+        'hot_news_base',
+        'ft_title_desc',
+        "ALTER TABLE `hot_news_base` ADD FULLTEXT INDEX `ft_title_desc` (`title`, `desc`) WITH PARSER ngram"
+    ),
+]
+
+
+def get_existing_tables(engine, table_names: Iterable[str]) -> Set[str]:
+    """一次查询返回给定表名中已存在的表"""
+    table_names = list(table_names)
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(
+                text("""
+                    SELECT table_name
+                    FROM information_schema.tables
+                    WHERE table_schema = DATABASE()
+                    AND table_name IN :table_names
+                """).bindparams(bindparam("table_names", expanding=True)),
+                {"table_names": table_names}
+            )
+            return {row[0] for row in result}
+    except Exception as e:
+        logger.error(f"检查表 {table_names} 是否存在时出错: {e}")
+        return set()
+
 
 def check_table_exists(engine, table_name: str) -> bool:
     """检查表是否存在"""
+    return table_name in get_existing_tables(engine, [table_name])
+
+
+def check_index_exists(engine, table_name: str, index_name: str) -> bool:
+    """检查表上的索引是否存在"""
     try:
         with engine.connect() as conn:
-            result = conn.execute(text(f"""
-                SELECT COUNT(*)
-                FROM information_schema.tables
-                WHERE table_schema = DATABASE()
-                AND table_name = '{table_name}'
-            """))
-            return result.scalar() > 0
+            result = conn.execute(
+                text("""
+                    SELECT COUNT(*)
+                    FROM information_schema.statistics
+                    WHERE table_schema = DATABASE()
+                    AND table_name = :table_name
+                    AND index_name = :index_name
+                """),
+                {"table_name": table_name, "index_name": index_name}
+            )
+            return bool(result.scalar())
     except Exception as e:
-        logger.error(f"检查表 {table_name} 是否存在时出错: {e}")
+        logger.error(f"检查索引 {table_name}.{index_name} 是否存在时出错: {e}")
         return False
 
 
@@ -50,9 +91,10 @@ def create_missing_tables():
 
         missing_tables = []
         existing_tables = []
+        found_tables = get_existing_tables(engine, required_tables)
 
         for table_name, model_class in required_tables.items():
-            if check_table_exists(engine, table_name):
+            if table_name in found_tables:
                 existing_tables.append(table_name)
                 logger.info(f"✅ 表 {table_name} 已存在")
             else:
@@ -88,8 +130,9 @@ def create_missing_tables():
         # 最终验证
         logger.info("🔍 最终验证所有表的存在性")
         all_exists = True
+        found_tables = get_existing_tables(engine, required_tables)
         for table_name, _ in required_tables.items():
-            if check_table_exists(engine, table_name):
+            if table_name in found_tables:
                 logger.info(f"✅ {table_name} - 存在")
             else:
                 logger.error(f"❌ {table_name} - 不存在")
@@ -108,6 +151,34 @@ def create_missing_tables():
         return False
 
 
+def create_missing_indexes():
+    """在已有表上补建缺失的索引"""
+    logger.info("🚀 开始检查并创建缺失的索引")
+
+    for table_name, index_name, ddl in REQUIRED_INDEXES:
+        if check_index_exists(engine, table_name, index_name):
+            logger.info(f"✅ 索引 {table_name}.{index_name} 已存在")
+            continue
+
+        logger.warning(f"⚠️ 索引 {table_name}.{index_name} 不存在，需要创建（大表上可能耗时较长）")
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(ddl))
+        except SQLAlchemyError as create_error:
+            logger.error(f"❌ 创建索引 {table_name}.{index_name} 时出错: {create_error}")
+            logger.exception("创建索引详细错误:")
+            return False
+
+        if check_index_exists(engine, table_name, index_name):
+            logger.success(f"✅ 索引 {table_name}.{index_name} 创建成功")
+        else:
+            logger.error(f"❌ 索引 {table_name}.{index_name} 创建失败（验证失败）")
+            return False
+
+    logger.success("🎉 所有必需的索引都已存在")
+    return True
+
+
 def show_table_structure():
     """显示创建的表结构信息"""
     logger.info("📋 显示 HotAggrEventHistoryRelation 表结构:")
@@ -145,17 +216,17 @@ def main():
     logger.info("-" * 40)
 
     try:
-        success = create_missing_tables()
+        success = create_missing_tables() and create_missing_indexes()
 
         duration = (datetime.now() - start_time).total_seconds()
 
         if success:
-            logger.success(f"🎯 数据库表创建完成，耗时: {duration:.2f}秒")
+            logger.success(f"🎯 数据库表和索引创建完成，耗时: {duration:.2f}秒")
             logger.info("📌 现在可以正常执行事件合并功能了")
             logger.info("📌 运行以下命令测试合并功能:")
             logger.info("   python main_combine.py")
         else:
-            logger.error(f"❌ 数据库表创建失败，耗时: {duration:.2f}秒")
+            logger.error(f"❌ 数据库表或索引创建失败，耗时: {duration:.2f}秒")
             logger.error("请检查数据库连接和权限设置")
             sys.exit(1)
 
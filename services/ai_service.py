@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 
@@ -16,6 +17,21 @@ from utils.retry import async_ai_service_retry
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def get_openai_client() -> AsyncOpenAI:
+    """
+    获取进程内共享的OpenAI异步客户端
+    
+    客户端内部持有httpx连接池，共享后各服务和各次调用复用已建立的连接，
+    避免每个服务实例各自建池、重复TLS握手
+    """
+    settings = get_settings()
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url
+    )
+
+
 @dataclass
 class AIResponse:
     """AI响应数据类"""
@@ -30,10 +46,7 @@ class AIService:
     
     def __init__(self):
         self.settings = get_settings()
-        self.client = AsyncOpenAI(
-            api_key=self.settings.openai_api_key,
-            base_url=self.settings.openai_base_url
-        )
+        self.client = get_openai_client()
         self.semaphore = asyncio.Semaphore(self.settings.max_concurrent_requests)
         
     @async_ai_service_retry
@@ -153,6 +153,16 @@ class SimpleCacheService:
         cache_key = f"llm_result:{input_hash}"
         self.set(cache_key, result, expire_time)
     
+    def get_cached_combine_result(self, prompt_hash: str) -> Optional[Dict]:
+        """获取缓存的事件合并分析结果"""
+        cache_key = f"combine_result:{prompt_hash}"
+        return self.get(cache_key)
+    
+    def cache_combine_result(self, prompt_hash: str, result: Dict, expire_time: int = 3600):
+        """缓存事件合并分析结果"""
+        cache_key = f"combine_result:{prompt_hash}"
+        self.set(cache_key, result, expire_time)
+    
     def get_cached_processing_status(self, batch_id: str) -> Optional[Dict]:
         """获取缓存的处理状态"""
         cache_key = f"processing_status:{batch_id}"
@@ -4,12 +4,12 @@
 """
 
 import asyncio
-import json
-from typing import List, Dict, Optional, Tuple, Callable, Union
+from typing import List, Dict, Optional, Set, Tuple, Callable, Union
 from datetime import datetime, timedelta
+import orjson
 from loguru import logger
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy import and_, desc, insert
 
 from database.connection import get_db_session
 from models.news_new import HotNewsBase, NewsEventRelation
@@ -18,6 +18,7 @@ from services.llm_wrapper import llm_wrapper
 from services.cache_service_simple import cache_service
 from services.prompt_templates import prompt_templates
 from config.settings import settings
+from utils.async_utils import run_in_threadpool
 
 
 class EventAggregationService:
@@ -46,7 +47,7 @@ class EventAggregationService:
             try:
                 if existing_regions.startswith('[') or existing_regions.startswith('{'):
                     # JSON格式
-                    regions_data = json.loads(existing_regions)
+                    regions_data = orjson.loads(existing_regions)
                     if isinstance(regions_data, list):
                         regions_set.update(regions_data)
                     elif isinstance(regions_data, str):
@@ -54,7 +55,7 @@ class EventAggregationService:
                 else:
                     # 逗号分隔格式
                     regions_set.update([r.strip() for r in existing_regions.split(',') if r.strip()])
-            except (json.JSONDecodeError, TypeError):
+            except (orjson.JSONDecodeError, TypeError):
                 # 直接作为字符串处理
                 regions_set.add(existing_regions.strip())
 
@@ -248,7 +249,11 @@ class EventAggregationService:
 
             logger.info(f"合并后总事件数: {len(all_events)} 个（最近事件: {len(recent_events)}, 已处理新闻事件: {len(processed_news_events)}）")
 
-            # 5. 调用大模型进行聚合
+            # 5. 调用大模型进行聚合，6. 处理聚合结果
+            # 每个批次的结果完成后立即入队，由入库协程顺序写库，与其余批次的大模型调用重叠进行
+            result_queue: asyncio.Queue = asyncio.Queue()
+            persist_task = None
+
             # 如果指定了批次大小，临时修改设置
             original_batch_size = None
             if batch_size:
@@ -257,29 +262,23 @@ class EventAggregationService:
                 settings.LLM_BATCH_SIZE = batch_size
 
             try:
+                persist_task = asyncio.create_task(self._persist_aggregation_results(result_queue))
                 success_results, failed_news = await llm_wrapper.process_news_concurrent(
                     news_list=news_list,
                     recent_events=all_events,  # 使用合并后的事件列表
                     prompt_template=prompt_templates.get_template('event_aggregation'),
                     validation_func=llm_wrapper.validate_aggregation_result,
-                    progress_callback=progress_callback
+                    progress_callback=progress_callback,
+                    result_callback=result_queue.put_nowait
                 )
             finally:
                 # 恢复原始批次大小
                 if original_batch_size is not None:
                     settings.LLM_BATCH_SIZE = original_batch_size
-
-            # 6. 处理聚合结果
-            processed_count = 0
-            all_processed_news_ids = set()
-
-            logger.info(f"开始处理 {len(success_results)} 个聚合结果批次")
-            for i, result in enumerate(success_results, 1):
-                logger.info(f"正在处理第 {i}/{len(success_results)} 个聚合结果批次")
-                count, processed_ids = await self._process_aggregation_result(result)
-                processed_count += count
-                all_processed_news_ids.update(processed_ids)
-                logger.info(f"第 {i} 个批次入库完成，处理新闻数: {count}，新闻ID: {processed_ids}")
+                # 结束标记，等待已入队的结果全部入库
+                if persist_task is not None:
+                    result_queue.put_nowait(None)
+                    processed_count, all_processed_news_ids = await persist_task
 
             # 7. 检查是否有遗漏的新闻
             input_news_ids = {news['id'] for news in news_list}
@@ -322,6 +321,35 @@ class EventAggregationService:
                 'duration': (datetime.now() - start_time).total_seconds()
             }
 
+    async def _persist_aggregation_results(self, result_queue: asyncio.Queue) -> Tuple[int, Set[int]]:
+        """
+        按完成顺序消费聚合结果并入库，直到收到结束标记None
+
+        Args:
+            result_queue: 聚合结果队列
+
+        Returns:
+            元组：(处理的新闻数量, 处理的新闻ID集合)
+        """
+        processed_count = 0
+        all_processed_news_ids = set()
+        batch_number = 0
+
+        while True:
+            result = await result_queue.get()
+            if result is None:
+                break
+
+            batch_number += 1
+            logger.info(f"正在处理第 {batch_number} 个聚合结果批次")
+            count, processed_ids = await self._process_aggregation_result(result)
+            processed_count += count
+            all_processed_news_ids.update(processed_ids)
+            logger.info(f"第 {batch_number} 个批次入库完成，处理新闻数: {count}，新闻ID: {processed_ids}")
+
+        logger.info(f"聚合结果入库完成，共 {batch_number} 个批次")
+        return processed_count, all_processed_news_ids
+
     def _get_news_to_process(
         self,
         add_time_start: Optional[datetime] = None,
@@ -504,9 +532,10 @@ class EventAggregationService:
             logger.error(f"获取最近事件失败: {e}")
             return []
 
-    async def _process_aggregation_result(self, result: Dict) -> Tuple[int, List[int]]:
+    @run_in_threadpool
+    def _process_aggregation_result(self, result: Dict) -> Tuple[int, List[int]]:
         """
-        处理聚合结果，更新数据库
+        处理聚合结果，更新数据库（同步数据库会话，在线程池中执行，不阻塞事件循环）
 
         Args:
             result: 大模型返回的聚合结果
@@ -551,35 +580,9 @@ class EventAggregationService:
                             event_record.updated_at = datetime.now()
 
                         # 保存新闻和事件的关联关系（检查重复）
-                        for news_id in news_ids:
-                            # 检查是否已存在相同的关联关系
-                            existing_relation = db.query(HotAggrNewsEventRelation).filter(
-                                HotAggrNewsEventRelation.news_id == news_id,
-                                HotAggrNewsEventRelation.event_id == event_id
-                            ).first()
-                            
-                            if existing_relation:
-                                logger.warning(f"新闻 {news_id} 与事件 {event_id} 的关联关系已存在，跳过插入")
-                                continue
-                                
-                            try:
-                                relation = HotAggrNewsEventRelation(
-                                    news_id=news_id,
-                                    event_id=event_id,
-                                    relation_type='归入已有事件',
-                                    confidence_score=existing_event.get('confidence', 0.8),
-                                    created_at=datetime.now()
-                                )
-                                db.add(relation)
-                            except Exception as relation_error:
-                                logger.error(f"插入新闻 {news_id} 与事件 {event_id} 关联关系失败: {relation_error}")
-                                # 回滚当前会话并继续处理其他关系
-                                try:
-                                    db.rollback()
-                                    logger.warning("数据库会话已回滚，继续处理其他关联关系")
-                                except Exception as rollback_error:
-                                    logger.error(f"会话回滚失败: {rollback_error}")
-                                continue
+                        self._insert_news_event_relations(
+                            db, event_id, news_ids, '归入已有事件', existing_event.get('confidence', 0.8)
+                        )
 
                         processed_count += len(news_ids)
                         processed_news_ids.extend(news_ids)
@@ -615,7 +618,7 @@ class EventAggregationService:
                             description=new_event['summary'],
                             category=new_event.get('category'),
                             event_type=new_event['event_type'],
-                            entities=json.dumps(new_event.get('entities', []), ensure_ascii=False) if new_event.get('entities') else None,
+                            entities=orjson.dumps(new_event.get('entities', [])).decode() if new_event.get('entities') else None,
                             sentiment=new_event.get('sentiment', '中性'),
                             regions=merged_regions,
                             keywords=','.join(new_event.get('tags', [])),
@@ -630,35 +633,9 @@ class EventAggregationService:
                         db.flush()  # 获取新插入的ID
 
                         # 关联新闻到事件（检查重复）
-                        for news_id in news_ids:
-                            # 检查是否已存在相同的关联关系
-                            existing_relation = db.query(HotAggrNewsEventRelation).filter(
-                                HotAggrNewsEventRelation.news_id == news_id,
-                                HotAggrNewsEventRelation.event_id == event.id
-                            ).first()
-                            
-                            if existing_relation:
-                                logger.warning(f"新闻 {news_id} 与事件 {event.id} 的关联关系已存在，跳过插入")
-                                continue
-                                
-                            try:
-                                relation = HotAggrNewsEventRelation(
-                                    news_id=news_id,
-                                    event_id=event.id,
-                                    relation_type='新建事件',
-                                    confidence_score=new_event.get('confidence', 0.8),
-                                    created_at=datetime.now()
-                                )
-                                db.add(relation)
-                            except Exception as relation_error:
-                                logger.error(f"插入新闻 {news_id} 与事件 {event.id} 关联关系失败: {relation_error}")
-                                # 回滚当前会话并继续处理其他关系
-                                try:
-                                    db.rollback()
-                                    logger.warning("数据库会话已回滚，继续处理其他关联关系")
-                                except Exception as rollback_error:
-                                    logger.error(f"会话回滚失败: {rollback_error}")
-                                continue
+                        self._insert_news_event_relations(
+                            db, event.id, news_ids, '新建事件', new_event.get('confidence', 0.8)
+                        )
 
                         processed_count += len(news_ids)
                         processed_news_ids.extend(news_ids)
@@ -692,6 +669,55 @@ class EventAggregationService:
 
         return processed_count, processed_news_ids
 
+    def _insert_news_event_relations(
+        self,
+        db,
+        event_id: int,
+        news_ids: List[int],
+        relation_type: str,
+        confidence_score: float
+    ) -> int:
+        """
+        批量保存新闻与事件的关联关系，跳过已存在的关联
+
+        一次查询判重、一次executemany插入，不再逐条查询和逐条INSERT
+
+        Args:
+            db: 数据库会话
+            event_id: 事件ID
+            news_ids: 新闻ID列表
+            relation_type: 关联类型
+            confidence_score: 关联置信度
+
+        Returns:
+            新插入的关联数量
+        """
+        existing_news_ids = {
+            row.news_id for row in db.query(HotAggrNewsEventRelation.news_id).filter(
+                HotAggrNewsEventRelation.event_id == event_id,
+                HotAggrNewsEventRelation.news_id.in_(news_ids)
+            )
+        }
+        if existing_news_ids:
+            logger.warning(f"新闻 {sorted(existing_news_ids)} 与事件 {event_id} 的关联关系已存在，跳过插入")
+
+        now = datetime.now()
+        # dict.fromkeys去除大模型结果中重复的新闻ID并保持顺序
+        rows = [
+            {
+                'news_id': news_id,
+                'event_id': event_id,
+                'relation_type': relation_type,
+                'confidence_score': confidence_score,
+                'created_at': now
+            }
+            for news_id in dict.fromkeys(news_ids)
+            if news_id not in existing_news_ids
+        ]
+        if rows:
+            db.execute(insert(HotAggrNewsEventRelation), rows)
+        return len(rows)
+
     def _safe_commit_with_partial_success(self, db, processed_news_ids: List[int], operation_name: str):
         """
         安全提交数据库事务，支持部分成功的情况
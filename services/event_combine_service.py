@@ -4,9 +4,10 @@
 """
 
 import asyncio
-import json
+import hashlib
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
+import orjson
 from loguru import logger
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc, or_
@@ -17,11 +18,51 @@ from models.hot_aggr_models import (
     HotAggrNewsEventRelation,
     HotAggrEventHistoryRelation
 )
+from services.cache_service_simple import cache_service
 from services.llm_wrapper import llm_wrapper
 from services.prompt_templates import prompt_templates
 from config.settings import settings
 
 
+# 合并分析用到的事件列，按列查询只取这些字段，不构造ORM实体、不进入会话标识映射
+_EVENT_COLUMNS = (
+    HotAggrEvent.id,
+    HotAggrEvent.title,
+    HotAggrEvent.description,
+    HotAggrEvent.event_type,
+    HotAggrEvent.sentiment,
+    HotAggrEvent.entities,
+    HotAggrEvent.regions,
+    HotAggrEvent.keywords,
+    HotAggrEvent.confidence_score,
+    HotAggrEvent.news_count,
+    HotAggrEvent.first_news_time,
+    HotAggrEvent.last_news_time,
+    HotAggrEvent.created_at,
+    HotAggrEvent.updated_at,
+)
+
+
+def _event_row_to_dict(row) -> Dict:
+    """将 _EVENT_COLUMNS 查询结果行转换为合并分析使用的事件字典"""
+    return {
+        'id': row.id,
+        'title': row.title or '',
+        'description': row.description or '',
+        'event_type': row.event_type or '',
+        'sentiment': row.sentiment or '',
+        'entities': row.entities or '',
+        'regions': row.regions or '',
+        'keywords': row.keywords or '',
+        'confidence_score': float(row.confidence_score or 0),
+        'news_count': row.news_count or 0,
+        'first_news_time': row.first_news_time,
+        'last_news_time': row.last_news_time,
+        'created_at': row.created_at,
+        'updated_at': row.updated_at
+    }
+
+
 class EventCombineService:
     """事件合并服务类（批量分析版）"""
 
@@ -45,30 +86,13 @@ class EventCombineService:
 
         try:
             with get_db_session() as db:
-                events = db.query(HotAggrEvent).filter(
+                events = db.query(*_EVENT_COLUMNS).filter(
                     HotAggrEvent.status == 1  # 只获取正常状态的事件
                 ).order_by(
                     desc(HotAggrEvent.created_at)
                 ).limit(count).all()
 
-                event_list = []
-                for event in events:
-                    event_list.append({
-                        'id': event.id,
-                        'title': event.title or '',
-                        'description': event.description or '',
-                        'event_type': event.event_type or '',
-                        'sentiment': event.sentiment or '',
-                        'entities': event.entities or '',
-                        'regions': event.regions or '',
-                        'keywords': event.keywords or '',
-                        'confidence_score': float(event.confidence_score or 0),
-                        'news_count': event.news_count or 0,
-                        'first_news_time': event.first_news_time,
-                        'last_news_time': event.last_news_time,
-                        'created_at': event.created_at,
-                        'updated_at': event.updated_at
-                    })
+                event_list = [_event_row_to_dict(row) for row in events]
 
                 logger.info(f"获取到 {len(event_list)} 个最近事件")
                 return event_list
@@ -89,31 +113,14 @@ class EventCombineService:
         """
         try:
             with get_db_session() as db:
-                events = db.query(HotAggrEvent).filter(
+                events = db.query(*_EVENT_COLUMNS).filter(
                     and_(
                         HotAggrEvent.id.in_(event_ids),
                         HotAggrEvent.status == 1  # 只获取正常状态的事件
                     )
                 ).all()
 
-                event_list = []
-                for event in events:
-                    event_list.append({
-                        'id': event.id,
-                        'title': event.title or '',
-                        'description': event.description or '',
-                        'event_type': event.event_type or '',
-                        'sentiment': event.sentiment or '',
-                        'entities': event.entities or '',
-                        'regions': event.regions or '',
-                        'keywords': event.keywords or '',
-                        'confidence_score': float(event.confidence_score or 0),
-                        'news_count': event.news_count or 0,
-                        'first_news_time': event.first_news_time,
-                        'last_news_time': event.last_news_time,
-                        'created_at': event.created_at,
-                        'updated_at': event.updated_at
-                    })
+                event_list = [_event_row_to_dict(row) for row in events]
 
                 logger.info(f"根据ID获取到 {len(event_list)} 个事件，请求ID: {event_ids}")
                 return event_list
@@ -154,13 +161,87 @@ class EventCombineService:
                 formatted_events.append(formatted_event)
 
             # 格式化为可读的JSON字符串
-            events_json = json.dumps(formatted_events, ensure_ascii=False, indent=2)
+            events_json = orjson.dumps(formatted_events, option=orjson.OPT_INDENT_2).decode()
             return events_json
 
         except Exception as e:
             logger.error(f"格式化事件列表失败: {e}")
             return "[]"  # 返回空数组作为fallback
 
+    @staticmethod
+    def _batch_merge_cache_key(prompt: str, model_name: str, temperature: float, max_tokens: int) -> str:
+        """批量合并分析的缓存键：模型参数与完整prompt（已包含规范化的事件JSON）的摘要"""
+        digest = hashlib.sha256(f"{model_name}|{temperature}|{max_tokens}|".encode('utf-8'))
+        digest.update(prompt.encode('utf-8'))
+        return digest.hexdigest()
+
+    async def _call_batch_merge_llm(self, prompt: str, model_name: str, temperature: float,
+                                    max_tokens: int) -> Tuple[Optional[Dict], float]:
+        """
+        调用LLM进行批量合并分析并解析JSON响应（含重试和JSON修复）
+
+        Returns:
+            (解析后的响应，失败时为None, LLM调用总耗时)
+        """
+        call_start_time = datetime.now()
+        response_text = None
+
+        # 重试机制
+        max_retries = getattr(settings, 'EVENT_COMBINE_RETRY_TIMES', 3)
+        for retry in range(max_retries):
+            try:
+                retry_start_time = datetime.now()
+                logger.info(f"  🔄 尝试 {retry + 1}/{max_retries}")
+
+                response_text = await llm_wrapper.call_llm_single(
+                    prompt=prompt,
+                    model=model_name,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+
+                retry_duration = (datetime.now() - retry_start_time).total_seconds()
+
+                if response_text:
+                    logger.info(f"  ✅ 批量分析成功，耗时: {retry_duration:.2f}秒")
+                    logger.info(f"  响应大小: {len(response_text)} 字符")
+                    break
+                else:
+                    logger.warning(f"  ⚠️ 响应为空，耗时: {retry_duration:.2f}秒")
+
+            except Exception as retry_error:
+                retry_duration = (datetime.now() - retry_start_time).total_seconds()
+                if retry == max_retries - 1:
+                    logger.error(f"  ❌ 最终失败，耗时: {retry_duration:.2f}秒, 错误: {retry_error}")
+                    raise retry_error
+                logger.warning(f"  🔄 重试 {retry + 1}/{max_retries}，耗时: {retry_duration:.2f}秒, 错误: {retry_error}")
+                await asyncio.sleep(2)  # 批量分析等待更久
+
+        total_duration = (datetime.now() - call_start_time).total_seconds()
+        logger.info(f"📊 LLM批量分析完成，总耗时: {total_duration:.2f}秒")
+
+        # 解析JSON响应
+        if not response_text:
+            logger.error("批量分析LLM响应为空")
+            return None, total_duration
+
+        try:
+            logger.info(f"  🔧 开始解析批量分析JSON响应...")
+            response = orjson.loads(response_text)
+            logger.info(f"  ✅ JSON解析成功")
+        except orjson.JSONDecodeError as json_error:
+            logger.warning(f"  ⚠️ JSON解析失败，尝试修复: {json_error}")
+            try:
+                import json_repair
+                response = json_repair.loads(response_text)
+                logger.info(f"  🔧 JSON修复成功")
+            except Exception as repair_error:
+                logger.error(f"  ❌ JSON修复失败: {repair_error}")
+                logger.debug(f"  原始响应前500字符: {response_text[:500]}...")
+                return None, total_duration
+
+        return response, total_duration
+
     async def analyze_events_batch_merge(self, events: List[Dict]) -> List[Dict]:
         """
         使用LLM批量分析事件列表，识别出应该合并的事件组
@@ -200,62 +281,21 @@ class EventCombineService:
             logger.info(f"  最大令牌: {max_tokens}")
             logger.info(f"  Prompt大小: {len(prompt)} 字符")
 
-            call_start_time = datetime.now()
-            response_text = None
-
-            # 重试机制
-            max_retries = getattr(settings, 'EVENT_COMBINE_RETRY_TIMES', 3)
-            for retry in range(max_retries):
-                try:
-                    retry_start_time = datetime.now()
-                    logger.info(f"  🔄 尝试 {retry + 1}/{max_retries}")
-
-                    response_text = await llm_wrapper.call_llm_single(
-                        prompt=prompt,
-                        model=model_name,
-                        temperature=temperature,
-                        max_tokens=max_tokens
-                    )
-
-                    retry_duration = (datetime.now() - retry_start_time).total_seconds()
-
-                    if response_text:
-                        logger.info(f"  ✅ 批量分析成功，耗时: {retry_duration:.2f}秒")
-                        logger.info(f"  响应大小: {len(response_text)} 字符")
-                        break
-                    else:
-                        logger.warning(f"  ⚠️ 响应为空，耗时: {retry_duration:.2f}秒")
-
-                except Exception as retry_error:
-                    retry_duration = (datetime.now() - retry_start_time).total_seconds()
-                    if retry == max_retries - 1:
-                        logger.error(f"  ❌ 最终失败，耗时: {retry_duration:.2f}秒, 错误: {retry_error}")
-                        raise retry_error
-                    logger.warning(f"  🔄 重试 {retry + 1}/{max_retries}，耗时: {retry_duration:.2f}秒, 错误: {retry_error}")
-                    await asyncio.sleep(2)  # 批量分析等待更久
-
-            total_duration = (datetime.now() - call_start_time).total_seconds()
-            logger.info(f"📊 LLM批量分析完成，总耗时: {total_duration:.2f}秒")
-
-            # 解析JSON响应
-            if not response_text:
-                logger.error("批量分析LLM响应为空")
-                return []
-
-            try:
-                logger.info(f"  🔧 开始解析批量分析JSON响应...")
-                response = json.loads(response_text)
-                logger.info(f"  ✅ JSON解析成功")
-            except json.JSONDecodeError as json_error:
-                logger.warning(f"  ⚠️ JSON解析失败，尝试修复: {json_error}")
-                try:
-                    import json_repair
-                    response = json_repair.loads(response_text)
-                    logger.info(f"  🔧 JSON修复成功")
-                except Exception as repair_error:
-                    logger.error(f"  ❌ JSON修复失败: {repair_error}")
-                    logger.debug(f"  原始响应前500字符: {response_text[:500]}...")
+            # 相同模型参数下对相同事件内容的分析结果直接复用，不再重复调用LLM
+            cache_key = self._batch_merge_cache_key(prompt, model_name, temperature, max_tokens)
+            response = cache_service.get_cached_combine_result(cache_key)
+            if response is not None:
+                logger.info("  ♻️ 命中批量分析缓存，跳过LLM调用")
+                total_duration = 0.0
+            else:
+                response, total_duration = await self._call_batch_merge_llm(
+                    prompt, model_name, temperature, max_tokens
+                )
+                if response is None:
                     return []
+                cache_service.cache_combine_result(
+                    cache_key, response, getattr(settings, 'EVENT_COMBINE_CACHE_TTL', 3600)
+                )
 
             # 处理批量分析结果
             merge_suggestions = []
@@ -365,7 +405,7 @@ class EventCombineService:
                     regions_str = event['regions']
                     if regions_str.startswith('['):
                         try:
-                            all_regions.update(json.loads(regions_str))
+                            all_regions.update(orjson.loads(regions_str))
                         except:
                             all_regions.update([r.strip() for r in regions_str.split(',') if r.strip()])
                     else:
@@ -463,7 +503,7 @@ class EventCombineService:
                     regions_str = event['regions']
                     if regions_str.startswith('['):
                         try:
-                            regions = json.loads(regions_str)
+                            regions = orjson.loads(regions_str)
                             all_regions.update(regions)
                         except:
                             regions = [r.strip() for r in regions_str.split(',') if r.strip()]
@@ -687,6 +727,36 @@ class EventCombineService:
                 logger.info(f"  🔄 处理次要事件: {[event.id for event in secondary_events]}")
                 total_transferred_news = 0
 
+                # 一次查询主事件和所有次要事件的新闻关联，在内存中判重后批量删除/转移，
+                # 避免逐条关联查询主事件是否已有该新闻
+                logger.debug(f"  🔍 查询主事件和次要事件的新闻关联")
+                try:
+                    relation_rows = db.query(
+                        HotAggrNewsEventRelation.id,
+                        HotAggrNewsEventRelation.news_id,
+                        HotAggrNewsEventRelation.event_id
+                    ).filter(
+                        HotAggrNewsEventRelation.event_id.in_(
+                            [primary_event_id] + [event.id for event in secondary_events]
+                        )
+                    ).all()
+
+                except Exception as relation_query_error:
+                    logger.error(f"❌ 查询新闻关联失败: {relation_query_error}")
+                    logger.exception("新闻关联查询详细错误:")
+                    return False
+
+                # 主事件已关联的新闻，转移过程中同步加入，多个次要事件包含同一新闻时只转移一次
+                primary_news_ids = set()
+                relations_by_event = {}
+                for row in relation_rows:
+                    if row.event_id == primary_event_id:
+                        primary_news_ids.add(row.news_id)
+                    else:
+                        relations_by_event.setdefault(row.event_id, []).append(row)
+                relation_ids_to_move = []
+                relation_ids_to_delete = []
+
                 for secondary_event in secondary_events:
                     try:
                         logger.debug(f"    🔄 开始处理次要事件 {secondary_event.id}")
@@ -697,57 +767,24 @@ class EventCombineService:
                         secondary_event.updated_at = datetime.now()
                         logger.debug(f"       状态更新: {old_status} -> 2")
 
-                        # 查询新闻关联 - 增强错误处理
-                        logger.debug(f"    🔍 查询事件 {secondary_event.id} 的新闻关联")
-                        try:
-                            news_relations = db.query(HotAggrNewsEventRelation).filter(
-                                HotAggrNewsEventRelation.event_id == secondary_event.id
-                            ).all()
-                            logger.debug(f"    📰 找到 {len(news_relations)} 个新闻关联")
-
-                        except Exception as relation_query_error:
-                            logger.error(f"❌ 查询事件{secondary_event.id}新闻关联失败: {relation_query_error}")
-                            logger.exception("新闻关联查询详细错误:")
-                            return False
+                        news_relations = relations_by_event.get(secondary_event.id, [])
+                        logger.debug(f"    📰 找到 {len(news_relations)} 个新闻关联")
 
                         transferred_news_count = 0
                         skipped_news_count = 0
-                        relation_errors = []
 
                         for relation in news_relations:
-                            try:
-                                # 检查主事件是否已经有这条新闻的关联
-                                existing_relation = db.query(HotAggrNewsEventRelation).filter(
-                                    and_(
-                                        HotAggrNewsEventRelation.news_id == relation.news_id,
-                                        HotAggrNewsEventRelation.event_id == primary_event_id
-                                    )
-                                ).first()
-
-                                if existing_relation:
-                                    # 删除重复关联
-                                    db.delete(relation)
-                                    skipped_news_count += 1
-                                    logger.debug(f"      ⏭️ 删除重复关联: 新闻{relation.news_id}")
-                                else:
-                                    # 转移到主事件
-                                    old_event_id = relation.event_id
-                                    relation.event_id = primary_event_id
-                                    transferred_news_count += 1
-                                    logger.debug(f"      ➡️ 转移新闻关联: 新闻{relation.news_id} ({old_event_id}->{primary_event_id})")
-
-                            except Exception as relation_error:
-                                relation_errors.append({
-                                    'news_id': relation.news_id,
-                                    'error': str(relation_error)
-                                })
-                                logger.error(f"      ❌ 处理新闻{relation.news_id}关联失败: {relation_error}")
-
-                        if relation_errors:
-                            logger.error(f"    ❌ 处理新闻关联时发生 {len(relation_errors)} 个错误")
-                            for error_info in relation_errors:
-                                logger.error(f"       新闻{error_info['news_id']}: {error_info['error']}")
-                            return False
+                            if relation.news_id in primary_news_ids:
+                                # 主事件已有这条新闻的关联，删除重复关联
+                                relation_ids_to_delete.append(relation.id)
+                                skipped_news_count += 1
+                                logger.debug(f"      ⏭️ 删除重复关联: 新闻{relation.news_id}")
+                            else:
+                                # 转移到主事件
+                                relation_ids_to_move.append(relation.id)
+                                primary_news_ids.add(relation.news_id)
+                                transferred_news_count += 1
+                                logger.debug(f"      ➡️ 转移新闻关联: 新闻{relation.news_id} ({secondary_event.id}->{primary_event_id})")
 
                         total_transferred_news += transferred_news_count
                         logger.info(f"    ✅ 事件{secondary_event.id}: 转移{transferred_news_count}个新闻, 跳过{skipped_news_count}个重复")
@@ -758,6 +795,26 @@ class EventCombineService:
                         logger.exception("次要事件处理详细错误:")
                         return False
 
+                # 批量删除重复关联、转移其余关联（先删除，避免与唯一索引uk_news_event冲突）
+                try:
+                    if relation_ids_to_delete:
+                        db.query(HotAggrNewsEventRelation).filter(
+                            HotAggrNewsEventRelation.id.in_(relation_ids_to_delete)
+                        ).delete(synchronize_session=False)
+                    if relation_ids_to_move:
+                        db.query(HotAggrNewsEventRelation).filter(
+                            HotAggrNewsEventRelation.id.in_(relation_ids_to_move)
+                        ).update(
+                            {HotAggrNewsEventRelation.event_id: primary_event_id},
+                            synchronize_session=False
+                        )
+                    logger.info(f"  ✅ 新闻关联批量处理完成: 转移{len(relation_ids_to_move)}条, 删除重复{len(relation_ids_to_delete)}条")
+
+                except Exception as relation_error:
+                    logger.error(f"❌ 批量处理新闻关联失败: {relation_error}")
+                    logger.exception("新闻关联处理详细错误:")
+                    return False
+
                 # 8. 记录合并历史关系 - 增强错误处理
                 logger.debug(f"  🔄 记录合并历史关系")
                 try:
@@ -881,6 +938,9 @@ class EventCombineService:
         try:
             logger.info(f"开始执行手动事件合并流程，事件ID: {event_ids}")
 
+            # 去除重复ID（保持顺序，第一个仍为主事件），否则数量比对会误判为缺失
+            event_ids = list(dict.fromkeys(event_ids))
+
             if len(event_ids) < 2:
                 return {
                     'status': 'error',
@@ -891,10 +951,11 @@ class EventCombineService:
                     'duration': (datetime.now() - start_time).total_seconds()
                 }
 
-            # 1. 获取指定的事件
+            # 1. 获取指定的事件（单次IN查询，只返回正常状态的事件）
             events = await self.get_events_by_ids(event_ids)
             if not events or len(events) != len(event_ids):
-                missing_ids = [eid for eid in event_ids if eid not in [e['id'] for e in events]]
+                found_ids = {event['id'] for event in events}
+                missing_ids = [eid for eid in event_ids if eid not in found_ids]
                 return {
                     'status': 'error',
                     'message': f'部分事件ID不存在或状态异常: {missing_ids}',
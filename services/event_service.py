@@ -3,14 +3,15 @@
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, func, select
 
-from database import get_db_session
+from database import AsyncSessionLocal, get_db_session, get_read_session
 from models.events_new import Event
 from models.news_new import NewsEventRelation
 from models.hot_aggr_models import HotAggrEventLabel, HotAggrEventHistoryRelation
 from models.news_new import HotNewsBase
 from utils.logger import get_logger
+from utils.async_utils import run_in_threadpool
 from utils.exceptions import DatabaseError, DataValidationError
 
 logger = get_logger(__name__)
@@ -22,7 +23,8 @@ class EventService:
     def __init__(self):
         self.logger = logger
     
-    async def create_event(
+    @run_in_threadpool
+    def create_event(
         self,
         title: str,
         description: str,
@@ -66,7 +68,8 @@ class EventService:
             self.logger.error(f"创建事件失败: {e}")
             raise DatabaseError(f"创建事件失败: {e}")
     
-    async def associate_news_to_event(
+    @run_in_threadpool
+    def associate_news_to_event(
         self,
         event_id: int,
         news_ids: List[int],
@@ -133,7 +136,8 @@ class EventService:
             self.logger.error(f"关联新闻到事件失败: {e}")
             raise DatabaseError(f"关联新闻到事件失败: {e}")
     
-    async def add_event_labels(
+    @run_in_threadpool
+    def add_event_labels(
         self,
         event_id: int,
         labels: Dict[str, Any]
@@ -193,7 +197,8 @@ class EventService:
             self.logger.error(f"添加事件标签失败: {e}")
             raise DatabaseError(f"添加事件标签失败: {e}")
     
-    async def create_event_history_relation(
+    @run_in_threadpool
+    def create_event_history_relation(
         self,
         new_event_id: int,
         historical_event_id: int,
@@ -264,7 +269,8 @@ class EventService:
             self.logger.error(f"创建事件历史关联失败: {e}")
             raise DatabaseError(f"创建事件历史关联失败: {e}")
     
-    async def get_event_with_details(self, event_id: int) -> Optional[Dict[str, Any]]:
+    @run_in_threadpool
+    def get_event_with_details(self, event_id: int) -> Optional[Dict[str, Any]]:
         """
         获取事件详细信息
         
@@ -275,7 +281,7 @@ class EventService:
             事件详细信息字典
         """
         try:
-            with get_db_session() as session:
+            with get_read_session() as session:
                 # 获取事件基本信息
                 event = session.query(Event).filter(Event.id == event_id).first()
                 if not event:
@@ -360,7 +366,8 @@ class EventService:
             self.logger.error(f"获取事件详情失败: {e}")
             raise DatabaseError(f"获取事件详情失败: {e}")
     
-    async def get_recent_events(
+    @run_in_threadpool
+    def get_recent_events(
         self,
         days: int = 7,
         limit: int = 50,
@@ -378,7 +385,7 @@ class EventService:
             事件列表
         """
         try:
-            with get_db_session() as session:
+            with get_read_session() as session:
                 start_date = datetime.now() - timedelta(days=days)
                 
                 query = session.query(Event).filter(
@@ -397,12 +404,21 @@ class EventService:
                 
                 events = query.all()
                 
+                # 一次分组查询取回所有事件的关联新闻数量，避免逐个事件COUNT
+                news_counts = {}
+                if events:
+                    news_counts = dict(
+                        session.query(
+                            NewsEventRelation.event_id,
+                            func.count(NewsEventRelation.id)
+                        ).filter(
+                            NewsEventRelation.event_id.in_([event.id for event in events])
+                        ).group_by(NewsEventRelation.event_id).all()
+                    )
+                
                 events_list = []
                 for event in events:
-                    # 获取关联新闻数量
-                    news_count = session.query(func.count(NewsEventRelation.id)).filter(
-                        NewsEventRelation.event_id == event.id
-                    ).scalar()
+                    news_count = news_counts.get(event.id, 0)
                     
                     event_dict = {
                         'id': event.id,
@@ -424,7 +440,29 @@ class EventService:
             self.logger.error(f"获取最近事件失败: {e}")
             raise DatabaseError(f"获取最近事件失败: {e}")
     
-    async def search_similar_events(
+    async def count_recent_events(self, days: int = 7) -> int:
+        """
+        统计最近的事件数量（单条COUNT查询，不加载事件数据）
+        
+        Args:
+            days: 最近天数
+            
+        Returns:
+            事件数量
+        """
+        try:
+            async with AsyncSessionLocal() as session:
+                start_date = datetime.now() - timedelta(days=days)
+                return await session.scalar(
+                    select(func.count(Event.id)).where(Event.created_at >= start_date)
+                )
+                
+        except Exception as e:
+            self.logger.error(f"统计最近事件数量失败: {e}")
+            raise DatabaseError(f"统计最近事件数量失败: {e}")
+    
+    @run_in_threadpool
+    def search_similar_events(
         self,
         keywords: List[str],
         days: int = 30,
@@ -445,7 +483,7 @@ class EventService:
             return []
         
         try:
-            with get_db_session() as session:
+            with get_read_session() as session:
                 start_date = datetime.now() - timedelta(days=days)
                 
                 # 构建关键词查询条件
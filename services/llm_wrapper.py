@@ -11,9 +11,9 @@ import os
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable, Tuple, Set
 from datetime import datetime
-import openai
 from loguru import logger
 from config.settings import settings
+from services.ai_service import get_openai_client
 from services.cache_service_simple import cache_service
 import uuid
 import time
@@ -24,10 +24,7 @@ class LLMWrapper:
     
     def __init__(self):
         """初始化大模型客户端"""
-        self.client = openai.AsyncOpenAI(
-            api_key=settings.OPENAI_API_KEY,
-            base_url=settings.OPENAI_BASE_URL
-        )
+        self.client = get_openai_client()
         self.batch_size = settings.EVENT_AGGREGATION_BATCH_SIZE
         self.max_concurrent = settings.EVENT_AGGREGATION_MAX_CONCURRENT
         self.retry_times = settings.EVENT_AGGREGATION_RETRY_TIMES
@@ -408,7 +405,8 @@ class LLMWrapper:
         recent_events: List[Dict],
         prompt_template: str,
         validation_func: Optional[Callable] = None,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        result_callback: Optional[Callable[[Dict], None]] = None
     ) -> Tuple[List[Dict], List[Dict]]:
         """
         并发处理新闻列表
@@ -419,6 +417,8 @@ class LLMWrapper:
             prompt_template: 提示词模板
             validation_func: 结果验证函数
             progress_callback: 进度回调函数
+            result_callback: 成功结果回调，每个批次成功后立即调用（不等待其他批次完成），
+                            便于调用方在其余批次仍在调用大模型时开始入库
             
         Returns:
             (成功结果列表, 失败的新闻列表)
@@ -432,18 +432,42 @@ class LLMWrapper:
         
         logger.info(f"开始并发处理，总新闻数: {len(news_list)}, 批次数: {len(batches)}")
         
+        success_results = []
+        failed_news = []
+        retry_news = []  # 需要重新处理的新闻
+        
+        def add_success(result: Dict):
+            """记录成功结果并立即通知调用方"""
+            success_results.append(result)
+            if result_callback:
+                result_callback(result)
+        
         # 创建信号量控制并发数
         semaphore = asyncio.Semaphore(self.max_concurrent)
         
         async def process_with_semaphore(batch_index: int, batch: List[Dict]):
-            """带信号量的批次处理"""
+            """带信号量的批次处理，批次完成后立即处理其结果"""
             async with semaphore:
-                result = await self.process_batch(
+                llm_result = await self.process_batch(
                     batch, recent_events, prompt_template, validation_func
                 )
                 if progress_callback:
                     progress_callback(batch_index + 1, len(batches), len(batch))
-                return batch_index, batch, result
+            
+            if llm_result is None:
+                failed_news.extend(batch)
+                logger.warning(f"批次 {batch_index + 1} 处理失败，新闻数量: {len(batch)}")
+            elif isinstance(llm_result, dict) and llm_result.get('partial_success'):
+                # 部分成功的情况
+                logger.info(f"批次 {batch_index + 1} 部分成功，保存有效结果，重新处理遗漏新闻")
+                add_success(llm_result['result'])
+                retry_news.extend(llm_result['missing_news'])
+            else:
+                # 完全成功的情况
+                if isinstance(llm_result, dict) and 'result' in llm_result:
+                    add_success(llm_result['result'])
+                else:
+                    add_success(llm_result)
         
         # 并发执行所有批次
         tasks = [
@@ -453,31 +477,9 @@ class LLMWrapper:
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
-        # 处理结果
-        success_results = []
-        failed_news = []
-        retry_news = []  # 需要重新处理的新闻
-        
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"批次处理异常: {result}")
-                continue
-                
-            batch_index, batch, llm_result = result
-            if llm_result is None:
-                failed_news.extend(batch)
-                logger.warning(f"批次 {batch_index + 1} 处理失败，新闻数量: {len(batch)}")
-            elif isinstance(llm_result, dict) and llm_result.get('partial_success'):
-                # 部分成功的情况
-                logger.info(f"批次 {batch_index + 1} 部分成功，保存有效结果，重新处理遗漏新闻")
-                success_results.append(llm_result['result'])
-                retry_news.extend(llm_result['missing_news'])
-            else:
-                # 完全成功的情况
-                if isinstance(llm_result, dict) and 'result' in llm_result:
-                    success_results.append(llm_result['result'])
-                else:
-                    success_results.append(llm_result)
         
         # 处理需要重新处理的新闻
         if retry_news:
@@ -496,9 +498,9 @@ class LLMWrapper:
                         retry_batch, recent_events, prompt_template, validation_func
                     )
                     if retry_result and not isinstance(retry_result, dict):
-                        success_results.append(retry_result)
+                        add_success(retry_result)
                     elif isinstance(retry_result, dict) and retry_result.get('result'):
-                        success_results.append(retry_result['result'])
+                        add_success(retry_result['result'])
                         # 如果还有遗漏，加入失败列表
                         if retry_result.get('missing_news'):
                             failed_news.extend(retry_result['missing_news'])
@@ -1,19 +1,151 @@
 """新闻数据服务模块"""
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import Integer, and_, bindparam, or_, desc, func, insert, select, text, update
+from sqlalchemy.dialects.mysql import match
 
-from database import get_db_session
+from database import AsyncSessionLocal, get_db_session, get_read_session
 from models.news_new import HotNewsBase, NewsProcessingStatus
 from models.enums import ProcessingStage
 from models.hot_aggr_models import HotAggrProcessingLog
 from utils.logger import get_logger
+from utils.async_utils import run_in_threadpool
 from utils.exceptions import DatabaseError, DataValidationError
 
 logger = get_logger(__name__)
 
+# 统计信息的进程内缓存（所有服务实例共享），并发调用者在锁上合并为一次查询
+STATISTICS_CACHE_TTL = 10
+_statistics_cache: Dict[str, Any] = {}
+_statistics_expires_at = 0.0
+_statistics_lock = asyncio.Lock()
+
+# 批量更新处理状态时每条语句包含的最大新闻ID数量
+STATUS_UPDATE_CHUNK_SIZE = 5000
+
+# 流式输出未处理新闻时每批读取的行数；每批读完即关闭会话归还连接，
+# 客户端读取再慢也不会长期占用连接池中的连接
+UNPROCESSED_STREAM_BATCH_SIZE = 200
+
+
+# 全文检索布尔模式下有特殊含义的字符，拼接查询串前替换为空格（"COVID-19"按短语"COVID 19"匹配）
+_FULLTEXT_OPERATORS = str.maketrans('+-<>()~*"@', " " * 10)
+
+# ngram分词的词元长度（MySQL ngram_token_size 默认值），更短的词无法通过全文索引命中
+FULLTEXT_MIN_TOKEN_LENGTH = 2
+
+# ft_title_desc 全文索引是否存在的检查结果缓存时间（秒），索引未创建时关键词检索退回LIKE
+FULLTEXT_INDEX_CHECK_TTL = 300
+_fulltext_index_exists = False
+_fulltext_index_expires_at = 0.0
+
+
+@lru_cache(maxsize=1024)
+def _build_fulltext_query(keywords: Tuple[str, ...]) -> str:
+    """
+    将关键词列表转换为 MATCH ... AGAINST 的布尔模式查询串
+    
+    每个关键词作为短语匹配，关键词之间为"或"关系，与原先逐个LIKE的语义一致。
+    任一关键词中含有短于ngram词元长度的词时返回空串，由调用方退回LIKE检索。
+    相同的关键词组合直接命中缓存。
+    """
+    phrases = [keyword.translate(_FULLTEXT_OPERATORS).strip() for keyword in keywords]
+    phrases = [phrase for phrase in phrases if phrase]
+    if not phrases or any(
+        len(word) < FULLTEXT_MIN_TOKEN_LENGTH
+        for phrase in phrases for word in phrase.split()
+    ):
+        return ""
+    return " ".join(f'"{phrase}"' for phrase in phrases)
+
+
+async def _has_fulltext_index(session) -> bool:
+    """
+    检查 hot_news_base 上的 ft_title_desc 全文索引是否已创建（结果按 FULLTEXT_INDEX_CHECK_TTL 缓存）
+    
+    索引由 scripts/create_missing_tables.py 创建，未执行迁移前关键词检索使用LIKE
+    """
+    global _fulltext_index_exists, _fulltext_index_expires_at
+    
+    if time.monotonic() >= _fulltext_index_expires_at:
+        index_count = await session.scalar(
+            text("""
+                SELECT COUNT(*)
+                FROM information_schema.statistics
+                WHERE table_schema = DATABASE()
+                AND table_name = :table_name
+                AND index_name = 'ft_title_desc'
+            """),
+            {"table_name": HotNewsBase.__tablename__}
+        )
+        _fulltext_index_exists = bool(index_count)
+        _fulltext_index_expires_at = time.monotonic() + FULLTEXT_INDEX_CHECK_TTL
+    return _fulltext_index_exists
+
+
+@lru_cache(maxsize=32)
+def _unprocessed_query_template(
+    has_start_time: bool,
+    has_end_time: bool,
+    has_include_types: bool,
+    has_exclude_types: bool,
+    has_limit: bool,
+    has_cursor: bool = False
+):
+    """
+    按过滤条件的组合构建未处理新闻查询语句
+    
+    取值全部以绑定参数传入，类型列表使用expanding绑定参数；
+    同一组合的语句只构建一次，执行时只绑定参数值
+    """
+    # 查询没有处理状态记录的新闻（即未处理的新闻）
+    # 或者处理状态为PENDING的新闻
+    query = select(HotNewsBase, NewsProcessingStatus.processing_stage).outerjoin(
+        NewsProcessingStatus, NewsProcessingStatus.news_id == HotNewsBase.id
+    ).where(
+        or_(
+            NewsProcessingStatus.processing_stage == ProcessingStage.PENDING,
+            NewsProcessingStatus.processing_stage.is_(None)  # 没有处理状态记录
+        )
+    )
+    
+    # 时间范围过滤
+    if has_start_time:
+        query = query.where(HotNewsBase.first_add_time >= bindparam('start_time'))
+    if has_end_time:
+        query = query.where(HotNewsBase.first_add_time <= bindparam('end_time'))
+    
+    # 类型过滤
+    if has_include_types:
+        query = query.where(HotNewsBase.type.in_(bindparam('include_types', expanding=True)))
+    elif has_exclude_types:
+        query = query.where(HotNewsBase.type.not_in(bindparam('exclude_types', expanding=True)))
+    
+    # 分批读取时从上一批最后一行之后继续（按 first_add_time, id 倒序的键集分页）
+    if has_cursor:
+        query = query.where(
+            or_(
+                HotNewsBase.first_add_time < bindparam('cursor_time'),
+                and_(
+                    HotNewsBase.first_add_time == bindparam('cursor_time'),
+                    HotNewsBase.id < bindparam('cursor_id')
+                )
+            )
+        )
+    
+    # 按时间倒序，优先处理最新的新闻；id作为同一时间内的稳定排序
+    query = query.order_by(desc(HotNewsBase.first_add_time), desc(HotNewsBase.id))
+    
+    if has_limit:
+        query = query.limit(bindparam('limit', type_=Integer))
+    
+    return query
+
 
 class NewsService:
     """新闻数据服务类"""
@@ -21,6 +153,63 @@ class NewsService:
     def __init__(self):
         self.logger = logger
     
+    @staticmethod
+    def _build_unprocessed_query(
+        limit: int,
+        exclude_types: Optional[List[str]],
+        include_types: Optional[List[str]],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        构建未处理新闻查询，返回 (语句, 绑定参数)，语句执行后得到 (新闻, 处理阶段) 行
+        
+        cursor为上一批最后一行的 (first_add_time, id)，传入时只查询排在其后的行
+        """
+        params: Dict[str, Any] = {}
+        if start_time:
+            params['start_time'] = start_time
+        if end_time:
+            params['end_time'] = end_time
+        # 类型过滤（include_types优先于exclude_types）
+        if include_types:
+            params['include_types'] = list(include_types)
+        elif exclude_types:
+            params['exclude_types'] = list(exclude_types)
+        if limit:
+            params['limit'] = limit
+        if cursor:
+            params['cursor_time'], params['cursor_id'] = cursor
+        
+        query = _unprocessed_query_template(
+            bool(start_time), bool(end_time),
+            'include_types' in params, 'exclude_types' in params,
+            bool(limit), bool(cursor)
+        )
+        return query, params
+    
+    @staticmethod
+    def _news_to_dict(news: HotNewsBase, processing_stage: Optional[str]) -> Dict[str, Any]:
+        """将新闻行及其处理阶段转换为字典格式"""
+        return {
+            'id': news.id,
+            'type': news.type,  # 新闻来源类型
+            'url': news.url,
+            'url_md5': news.url_md5,
+            'title': news.title,
+            'desc': news.desc,  # 导语或摘要
+            'content': news.content,
+            'city_name': news.city_name,
+            'first_add_time': news.first_add_time,  # 首次添加时间
+            'last_update_time': news.last_update_time,  # 最后更新时间
+            'highest_rank': news.highest_rank,  # 最高排名
+            'lowest_rank': news.lowest_rank,  # 最低排名
+            'latest_rank': news.latest_rank,  # 最新排名
+            'highest_hot_num': news.highest_hot_num,  # 最高热点值
+            'processing_status': processing_stage
+        }
+    
     async def get_unprocessed_news(
         self,
         limit: int = 100,
@@ -43,57 +232,17 @@ class NewsService:
             未处理新闻列表
         """
         try:
-            with get_db_session() as session:
-                # 查询没有处理状态记录的新闻（即未处理的新闻）
-                # 或者处理状态为PENDING的新闻
-                query = session.query(HotNewsBase).outerjoin(NewsProcessingStatus).filter(
-                    or_(
-                        NewsProcessingStatus.processing_stage == ProcessingStage.PENDING,
-                        NewsProcessingStatus.processing_stage.is_(None)  # 没有处理状态记录
-                    )
+            async with AsyncSessionLocal() as session:
+                query, params = self._build_unprocessed_query(
+                    limit, exclude_types, include_types, start_time, end_time
                 )
-                
-                # 时间范围过滤
-                if start_time:
-                    query = query.filter(HotNewsBase.first_add_time >= start_time)
-                if end_time:
-                    query = query.filter(HotNewsBase.first_add_time <= end_time)
-                
-                # 类型过滤（include_types优先于exclude_types）
-                if include_types:
-                    query = query.filter(HotNewsBase.type.in_(include_types))
-                elif exclude_types:
-                    query = query.filter(~HotNewsBase.type.in_(exclude_types))
-                
-                # 按时间倒序，优先处理最新的新闻
-                query = query.order_by(desc(HotNewsBase.first_add_time))
-                
-                if limit:
-                    query = query.limit(limit)
-                
-                news_records = query.all()
+                news_records = (await session.execute(query, params)).all()
                 
                 # 转换为字典格式
-                news_list = []
-                for news in news_records:
-                    news_dict = {
-                        'id': news.id,
-                        'type': news.type,  # 新闻来源类型
-                        'url': news.url,
-                        'url_md5': news.url_md5,
-                        'title': news.title,
-                        'desc': news.desc,  # 导语或摘要
-                        'content': news.content,
-                        'city_name': news.city_name,
-                        'first_add_time': news.first_add_time,  # 首次添加时间
-                        'last_update_time': news.last_update_time,  # 最后更新时间
-                        'highest_rank': news.highest_rank,  # 最高排名
-                        'lowest_rank': news.lowest_rank,  # 最低排名
-                        'latest_rank': news.latest_rank,  # 最新排名
-                        'highest_hot_num': news.highest_hot_num,  # 最高热点值
-                        'processing_status': news.processing_status.processing_stage if news.processing_status else None
-                    }
-                    news_list.append(news_dict)
+                news_list = [
+                    self._news_to_dict(news, processing_stage)
+                    for news, processing_stage in news_records
+                ]
                 
                 # 构建日志信息
                 filter_info = []
@@ -114,8 +263,53 @@ class NewsService:
             self.logger.error(f"获取未处理新闻失败: {e}")
             raise DatabaseError(f"获取未处理新闻失败: {e}")
     
-
-    async def get_news_by_ids(self, news_ids: List[int]) -> List[Dict[str, Any]]:
+    async def stream_unprocessed_news(
+        self,
+        limit: int = 100,
+        exclude_types: Optional[List[str]] = None,
+        include_types: Optional[List[str]] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        分批读取未处理的新闻数据并逐条产出
+        
+        参数与get_unprocessed_news一致；每批最多 UNPROCESSED_STREAM_BATCH_SIZE 行，
+        按键集分页读取，每批查询结束即关闭会话、归还连接，再产出本批数据。
+        慢速客户端只会延后下一批查询，不会长期占用连接池中的连接和事务
+        
+        Yields:
+            未处理新闻字典
+        """
+        remaining = limit
+        cursor = None
+        
+        while True:
+            batch_limit = min(UNPROCESSED_STREAM_BATCH_SIZE, remaining) if limit else UNPROCESSED_STREAM_BATCH_SIZE
+            try:
+                async with AsyncSessionLocal() as session:
+                    query, params = self._build_unprocessed_query(
+                        batch_limit, exclude_types, include_types, start_time, end_time, cursor
+                    )
+                    news_records = (await session.execute(query, params)).all()
+            except Exception as e:
+                self.logger.error(f"流式获取未处理新闻失败: {e}")
+                raise DatabaseError(f"流式获取未处理新闻失败: {e}")
+            
+            for news, processing_stage in news_records:
+                yield self._news_to_dict(news, processing_stage)
+            
+            if len(news_records) < batch_limit:
+                return
+            if limit:
+                remaining -= len(news_records)
+                if remaining <= 0:
+                    return
+            last_news = news_records[-1][0]
+            cursor = (last_news.first_add_time, last_news.id)
+    
+    @run_in_threadpool
+    def get_news_by_ids(self, news_ids: List[int]) -> List[Dict[str, Any]]:
         """
         根据ID列表获取新闻
         
@@ -129,7 +323,7 @@ class NewsService:
             return []
         
         try:
-            with get_db_session() as session:
+            with get_read_session() as session:
                 news_records = session.query(HotNewsBase).filter(
                     HotNewsBase.id.in_(news_ids)
                 ).all()
@@ -162,7 +356,8 @@ class NewsService:
             self.logger.error(f"根据ID获取新闻失败: {e}")
             raise DatabaseError(f"根据ID获取新闻失败: {e}")
     
-    async def update_news_status(
+    @run_in_threadpool
+    def update_news_status(
         self,
         news_ids: List[int],
         stage: str,
@@ -183,39 +378,53 @@ class NewsService:
             return True
         
         try:
+            now = datetime.now()
+            unique_ids = list(dict.fromkeys(news_ids))
+            
             with get_db_session() as session:
-                updated_count = 0
-                
-                for news_id in news_ids:
-                    # 查找或创建处理状态记录
-                    status_record = session.query(NewsProcessingStatus).filter(
-                        NewsProcessingStatus.news_id == news_id
-                    ).first()
+                # 分块执行，单条语句的IN列表不超过max_allowed_packet
+                for offset in range(0, len(unique_ids), STATUS_UPDATE_CHUNK_SIZE):
+                    chunk = unique_ids[offset:offset + STATUS_UPDATE_CHUNK_SIZE]
                     
-                    if status_record:
-                        # 更新现有记录
-                        status_record.processing_stage = stage
-                        status_record.last_processed_at = datetime.now()
-                        status_record.updated_at = datetime.now()
+                    # 一次查询找出已有处理状态记录的新闻
+                    existing_ids = set(session.scalars(
+                        select(NewsProcessingStatus.news_id).where(
+                            NewsProcessingStatus.news_id.in_(chunk)
+                        )
+                    ))
+                    
+                    # 已有记录：单条UPDATE批量更新
+                    if existing_ids:
+                        values = {
+                            'processing_stage': stage,
+                            'last_processed_at': now,
+                            'updated_at': now,
+                            'error_message': error_message
+                        }
                         if error_message:
-                            status_record.error_message = error_message
-                            status_record.retry_count += 1
-                        else:
-                            status_record.error_message = None
-                    else:
-                        # 创建新记录
-                        status_record = NewsProcessingStatus(
-                            news_id=news_id,
-                            processing_stage=stage,
-                            last_processed_at=datetime.now(),
-                            error_message=error_message,
-                            retry_count=1 if error_message else 0
+                            values['retry_count'] = NewsProcessingStatus.retry_count + 1
+                        session.execute(
+                            update(NewsProcessingStatus).where(
+                                NewsProcessingStatus.news_id.in_(existing_ids)
+                            ).values(**values).execution_options(synchronize_session=False)
                         )
-                        session.add(status_record)
                     
-                    updated_count += 1
+                    # 没有记录：一次executemany批量插入
+                    new_records = [
+                        {
+                            'news_id': news_id,
+                            'processing_stage': stage,
+                            'last_processed_at': now,
+                            'error_message': error_message,
+                            'retry_count': 1 if error_message else 0
+                        }
+                        for news_id in chunk if news_id not in existing_ids
+                    ]
+                    if new_records:
+                        session.execute(insert(NewsProcessingStatus), new_records)
                 
                 session.commit()
+                updated_count = len(unique_ids)
                 
                 self.logger.info(f"更新了 {updated_count} 条新闻状态为 {stage}")
                 return updated_count > 0
@@ -224,33 +433,53 @@ class NewsService:
             self.logger.error(f"更新新闻状态失败: {e}")
             raise DatabaseError(f"更新新闻状态失败: {e}")
     
-    async def get_news_statistics(self) -> Dict[str, Any]:
+    async def get_news_statistics(self, use_cache: bool = True) -> Dict[str, Any]:
         """
         获取新闻处理统计信息
         
+        Args:
+            use_cache: 是否使用短时缓存（连接测试等场景需要实际查询数据库）
+            
         Returns:
             统计信息字典
         """
+        global _statistics_cache, _statistics_expires_at
+        
+        if not use_cache:
+            return await self._query_news_statistics()
+        
+        async with _statistics_lock:
+            if time.monotonic() >= _statistics_expires_at:
+                _statistics_cache = await self._query_news_statistics()
+                _statistics_expires_at = time.monotonic() + STATISTICS_CACHE_TTL
+            return _statistics_cache
+    
+    async def _query_news_statistics(self) -> Dict[str, Any]:
+        """从数据库查询新闻处理统计信息"""
         try:
-            with get_db_session() as session:
+            async with AsyncSessionLocal() as session:
                 # 总新闻数
-                total_count = session.query(func.count(HotNewsBase.id)).scalar()
+                total_count = await session.scalar(select(func.count(HotNewsBase.id)))
                 
                 # 处理状态统计
-                processed_count = session.query(func.count(NewsProcessingStatus.id)).scalar()
+                processed_count = await session.scalar(select(func.count(NewsProcessingStatus.id)))
                 unprocessed_count = total_count - processed_count
                 
                 # 今日新增新闻数
                 today = datetime.now().date()
-                today_count = session.query(func.count(HotNewsBase.id)).filter(
-                    func.date(HotNewsBase.first_add_time) == today
-                ).scalar()
+                today_count = await session.scalar(
+                    select(func.count(HotNewsBase.id)).where(
+                        func.date(HotNewsBase.first_add_time) == today
+                    )
+                )
                 
                 # 各类型新闻数（限制前10个）
-                type_counts_query = session.query(
-                    HotNewsBase.type,
-                    func.count(HotNewsBase.id)
-                ).group_by(HotNewsBase.type).limit(10).all()
+                type_counts_query = (await session.execute(
+                    select(
+                        HotNewsBase.type,
+                        func.count(HotNewsBase.id)
+                    ).group_by(HotNewsBase.type).limit(10)
+                )).all()
                 
                 type_stats = {news_type or "未知": count for news_type, count in type_counts_query}
                 
@@ -287,54 +516,52 @@ class NewsService:
         Returns:
             相关新闻列表
         """
+        keywords = [keyword.strip() for keyword in keywords if keyword and keyword.strip()]
         if not keywords:
             return []
         
+        fulltext_query = _build_fulltext_query(tuple(keywords))
+        
         try:
-            with get_db_session() as session:
+            async with AsyncSessionLocal() as session:
                 # 计算时间范围
                 start_date = datetime.now() - timedelta(days=days)
                 
-                # 构建关键词查询条件
-                keyword_conditions = []
-                for keyword in keywords:
-                    keyword_conditions.extend([
-                        HotNewsBase.title.contains(keyword),
-                        HotNewsBase.desc.contains(keyword)
-                    ])
-                
-                query = session.query(HotNewsBase).filter(
+                if fulltext_query and await _has_fulltext_index(session):
+                    # 所有关键词合并为一个布尔模式全文检索条件，走 ft_title_desc 索引
+                    keyword_condition = match(
+                        HotNewsBase.title, HotNewsBase.desc,
+                        against=fulltext_query
+                    ).in_boolean_mode()
+                else:
+                    # 全文索引未创建或关键词过短时，逐个关键词匹配标题和摘要
+                    keyword_conditions = []
+                    for keyword in keywords:
+                        keyword_conditions.extend([
+                            HotNewsBase.title.contains(keyword),
+                            HotNewsBase.desc.contains(keyword)
+                        ])
+                    keyword_condition = or_(*keyword_conditions)
+                
+                # 关联处理状态表，返回每条新闻实际的处理阶段（无状态记录时为None）
+                query = select(HotNewsBase, NewsProcessingStatus.processing_stage).outerjoin(
+                    NewsProcessingStatus, NewsProcessingStatus.news_id == HotNewsBase.id
+                ).where(
                     and_(
                         HotNewsBase.first_add_time >= start_date,
-                        or_(*keyword_conditions)
+                        keyword_condition
                     )
                 ).order_by(desc(HotNewsBase.first_add_time))
                 
                 if limit:
                     query = query.limit(limit)
                 
-                news_records = query.all()
+                news_records = (await session.execute(query)).all()
                 
-                news_list = []
-                for news in news_records:
-                    news_dict = {
-                        'id': news.id,
-                        'type': news.type,  # 新闻来源类型
-                        'url': news.url,
-                        'url_md5': news.url_md5,
-                        'title': news.title,
-                        'desc': news.desc,
-                        'content': news.content,
-                        'city_name': news.city_name,
-                        'first_add_time': news.first_add_time,
-                        'last_update_time': news.last_update_time,
-                        'highest_rank': news.highest_rank,
-                        'lowest_rank': news.lowest_rank,
-                        'latest_rank': news.latest_rank,
-                        'highest_hot_num': news.highest_hot_num,
-                        'processing_status': hasattr(news, 'processing_status') and news.processing_status
-                    }
-                    news_list.append(news_dict)
+                news_list = [
+                    self._news_to_dict(news, processing_stage)
+                    for news, processing_stage in news_records
+                ]
                 
                 self.logger.info(f"根据关键词获取到 {len(news_list)} 条相关新闻")
                 return news_list
@@ -344,7 +571,8 @@ class NewsService:
             raise DatabaseError(f"根据关键词获取新闻失败: {e}")
     
 
-    async def log_processing_progress(
+    @run_in_threadpool
+    def log_processing_progress(
         self,
         task_name: str,
         total_count: int,
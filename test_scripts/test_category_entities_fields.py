@@ -7,6 +7,7 @@ import asyncio
 import json
 from datetime import datetime, timedelta
 from loguru import logger
+from sqlalchemy import text
 from database.connection import get_db_session
 from models.hot_aggr_models import HotAggrEvent
 from models.news_new import HotNewsBase
@@ -81,8 +82,13 @@ async def test_database_schema():
     
     try:
         with get_db_session() as db:
-            # 查询表结构
-            result = db.execute("DESCRIBE hot_aggr_events").fetchall()
+            # 查询表结构（information_schema单条查询，只取需要的列）
+            result = db.execute(text("""
+                SELECT column_name, column_type
+                FROM information_schema.columns
+                WHERE table_schema = DATABASE() AND table_name = 'hot_aggr_events'
+                ORDER BY ordinal_position
+            """)).fetchall()
             
             logger.info("hot_aggr_events表结构:")
             category_exists = False
@@ -2,6 +2,8 @@
 
 from .logger import setup_logger, get_logger
 from .retry import retry_with_backoff
+from .async_utils import install_uvloop, run_in_threadpool
+from .datetime_utils import DATETIME_FORMAT, parse_datetime
 from .exceptions import (
     HotListAggregationError,
     DatabaseError,
@@ -14,6 +16,10 @@ __all__ = [
     "setup_logger",
     "get_logger", 
     "retry_with_backoff",
+    "install_uvloop",
+    "run_in_threadpool",
+    "DATETIME_FORMAT",
+    "parse_datetime",
     "HotListAggregationError",
     "DatabaseError",
     "AIServiceError",
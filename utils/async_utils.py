@@ -0,0 +1,40 @@
+"""异步执行工具"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def install_uvloop() -> None:
+    """
+    安装uvloop事件循环策略（已安装时）
+    
+    需要在asyncio.run创建事件循环前调用（asyncio.run启动时uvicorn的loop配置也不会生效）；
+    未安装uvloop（如Windows环境）时使用默认的asyncio事件循环
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def run_in_threadpool(func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+    """
+    将同步阻塞函数包装为协程函数，调用时在线程池中执行
+    
+    用于仍使用同步数据库会话的服务方法：调用方照常 await，
+    阻塞的数据库IO不会占用事件循环
+    
+    Args:
+        func: 同步函数
+        
+    Returns:
+        协程函数
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
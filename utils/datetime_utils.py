@@ -0,0 +1,39 @@
+"""时间解析工具"""
+
+from datetime import datetime
+
+# 系统内统一使用的时间字符串格式
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_datetime(value: str) -> datetime:
+    """
+    解析 "YYYY-MM-DD HH:MM:SS" 格式的时间字符串
+    
+    格式固定时各字段位置已知，直接按切片取整构造datetime，
+    不经过strptime的格式串解析；长度、分隔符不符（如月份未补零）或字段含非数字字符
+    （int()会接受的正负号、空格）时回退到strptime，保证与strptime的校验一致
+    
+    Args:
+        value: 时间字符串
+        
+    Returns:
+        datetime对象
+        
+    Raises:
+        ValueError: 格式错误或时间值非法
+    """
+    if (
+        len(value) == 19
+        and value[4] == "-" and value[7] == "-" and value[10] == " "
+        and value[13] == ":" and value[16] == ":"
+        and (value[0:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]).isdigit()
+    ):
+        try:
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19])
+            )
+        except ValueError:
+            pass
+    return datetime.strptime(value, DATETIME_FORMAT)
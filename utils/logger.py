@@ -1,6 +1,7 @@
 """日志配置模块"""
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -9,6 +10,20 @@ from loguru import logger
 from config import get_settings
 
 
+# 控制台日志格式
+_CONSOLE_FORMAT_DEBUG = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+_CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<level>{message}</level>"
+)
+
+
 def setup_logger(
     log_file: Optional[str] = None,
     log_level: str = "INFO",
@@ -33,19 +48,20 @@ def setup_logger(
     
     # 设置默认格式
     if format_string is None:
-        format_string = settings.log_format
+        format_string = settings.resolved_log_format
+    
+    # 调试模式输出模块、函数和行号，并在异常堆栈中展示变量值；
+    # 生产环境省去这些字段的格式化和异常时的变量渲染
+    debug = settings.debug
     
     # 控制台输出（带颜色）
     logger.add(
         sys.stdout,
         level=log_level,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-               "<level>{level: <8}</level> | "
-               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-               "<level>{message}</level>",
+        format=_CONSOLE_FORMAT_DEBUG if debug else _CONSOLE_FORMAT,
         colorize=True,
         backtrace=True,
-        diagnose=True
+        diagnose=debug
     )
     
     # 文件输出
@@ -62,7 +78,7 @@ def setup_logger(
             retention=retention,
             encoding="utf-8",
             backtrace=True,
-            diagnose=True
+            diagnose=debug
         )
     
     # 错误日志单独文件
@@ -76,13 +92,14 @@ def setup_logger(
             retention=retention,
             encoding="utf-8",
             backtrace=True,
-            diagnose=True
+            diagnose=debug
         )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = __name__):
     """
-    获取日志记录器
+    获取日志记录器（按名称缓存，同名模块共享同一个绑定实例）
     
     Args:
         name: 日志记录器名称
@@ -102,7 +119,7 @@ def init_logger():
         log_level=settings.log_level,
         rotation=settings.log_rotation,
         retention=settings.log_retention,
-        format_string=settings.log_format
+        format_string=settings.resolved_log_format
     )
 
 